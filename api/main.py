@@ -9,14 +9,14 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional, List
 import os
-import tempfile
+import itertools
 import logging
 
 from src.resume_parser import ResumeParser
 from src.nlp_processor import NLPProcessor
 from src.job_matcher import JobMatcher
 from src.ats_scorer import ATSScorer
-from src.utils import setup_logging, log_analysis, validate_file_upload
+from src.utils import setup_logging, log_analysis, validate_file_bytes
 
 # Setup logging
 setup_logging()
@@ -93,30 +93,26 @@ async def analyze_resume(
         Analysis results including ATS score, skills, and matches
     """
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_file_path = tmp_file.name
+        # Parse the upload in memory rather than via a temp file
+        content = await file.read()
         
         # Validate file
-        validate_file_upload(tmp_file_path)
+        validate_file_bytes(content, file.filename)
         
         # Parse resume
         logger.info(f"Parsing resume: {file.filename}")
-        parsed_data = resume_parser.parse_file(tmp_file_path)
+        parsed_data = resume_parser.parse_bytes(content, file.filename)
         resume_text = parsed_data['cleaned_text']
         
         # Extract skills
-        logger.info("Extracting skills")
-        skills = nlp_processor.extract_skills(resume_text)
+        logger.info("Extracting skills, experience and education")
+        resume_info = nlp_processor.extract_all(resume_text)
+        skills = resume_info['skills']
         
-        # Extract experience
-        experiences = nlp_processor.extract_experience(resume_text)
-        experience_years = nlp_processor.calculate_experience_years(resume_text)
-        
-        # Extract education
-        education = nlp_processor.extract_education(resume_text)
+        # Experience and education
+        experiences = resume_info['experiences']
+        experience_years = resume_info['experience_years']
+        education = resume_info['education']
         
         # Calculate ATS score
         logger.info("Calculating ATS score")
@@ -132,8 +128,8 @@ async def analyze_resume(
             
             # Extract skills from job description
             jd_skills = nlp_processor.extract_skills(job_description)
-            all_resume_skills = [skill for skills_list in skills.values() for skill in skills_list]
-            all_jd_skills = [skill for skills_list in jd_skills.values() for skill in skills_list]
+            all_resume_skills = list(itertools.chain.from_iterable(skills.values()))
+            all_jd_skills = list(itertools.chain.from_iterable(jd_skills.values()))
             
             # Skill gap analysis
             skill_gap = job_matcher.analyze_skill_match(all_resume_skills, all_jd_skills)
@@ -156,9 +152,6 @@ async def analyze_resume(
             job_matches['similarity_score'] if job_matches else None
         )
         
-        # Clean up temp file
-        os.unlink(tmp_file_path)
-        
         # Prepare response
         response_data = {
             'file_name': file.filename,
@@ -200,13 +193,9 @@ async def match_jobs(
         Ranked list of job matches
     """
     try:
-        # Save and parse resume
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_file_path = tmp_file.name
-        
-        parsed_data = resume_parser.parse_file(tmp_file_path)
+        # Parse resume
+        content = await file.read()
+        parsed_data = resume_parser.parse_bytes(content, file.filename)
         resume_text = parsed_data['cleaned_text']
         
         # Create job descriptions from titles
@@ -215,9 +204,6 @@ async def match_jobs(
         # Match jobs
         matches = job_matcher.match_jobs(resume_text, jobs, top_k=len(jobs))
         
-        # Clean up
-        os.unlink(tmp_file_path)
-        
         return {
             'success': True,
             'data': {
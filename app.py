@@ -4,9 +4,15 @@ Interactive web interface for Resume Analyzer.
 """
 
 import gradio as gr
+import jinja2
+import asyncio
+import functools
+import itertools
 import os
+import re
 import sys
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import logging
 
 # Add src to path
@@ -16,18 +22,26 @@ from src.resume_parser import ResumeParser
 from src.nlp_processor import NLPProcessor
 from src.job_matcher import JobMatcher
 from src.ats_scorer import ATSScorer
-from src.utils import setup_logging, log_analysis, format_skills_list, load_json
+from src.utils import (
+    setup_logging, log_analysis, format_skills_list, load_json, text_hash, LRUCache,
+    validate_file_upload
+)
+
+# HTML templates for the result panels, compiled once at import
+_template_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+    autoescape=jinja2.select_autoescape(["html"]),
+    auto_reload=False
+)
+TEMPLATES = {
+    name: _template_env.get_template(f"{name}.html")
+    for name in ("overview", "ats", "skills", "job_match", "recommendations", "batch")
+}
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
-# Initialize components
-logger.info("Initializing Resume Analyzer components...")
-resume_parser = ResumeParser()
-nlp_processor = NLPProcessor()
-job_matcher = JobMatcher()
-ats_scorer = ATSScorer()
 
 # Load sample job database
 try:
@@ -38,296 +52,381 @@ except:
     logger.warning("No job database found")
 
 
-def analyze_resume(
+# Components are created lazily on first use, so importing this module stays
+# cheap. In pre-forked deployments, preloading in the parent lets workers
+# share the loaded models copy-on-write.
+@functools.cache
+def get_resume_parser() -> ResumeParser:
+    """Return the shared ResumeParser instance."""
+    return ResumeParser()
+
+
+@functools.cache
+def get_nlp_processor() -> NLPProcessor:
+    """Return the shared NLPProcessor instance."""
+    return NLPProcessor()
+
+
+@functools.cache
+def get_job_matcher() -> JobMatcher:
+    """Return the shared JobMatcher instance, with the job database indexed."""
+    job_matcher = JobMatcher()
+    job_matcher.build_job_index(
+        job_database.get('jobs', []),
+        cache_dir=os.getenv('MODEL_CACHE_DIR', './model_cache')
+    )
+    return job_matcher
+
+
+@functools.cache
+def get_ats_scorer() -> ATSScorer:
+    """Return the shared ATSScorer instance."""
+    return ATSScorer()
+
+
+def preload_components():
+    """
+    Construct all components, loading their models.
+    
+    The spaCy and sentence-transformer loads are I/O bound, so the
+    components are built concurrently and startup takes about as long as
+    the slowest one.
+    """
+    logger.info("Initializing Resume Analyzer components...")
+    getters = (get_resume_parser, get_nlp_processor, get_job_matcher, get_ats_scorer)
+    with ThreadPoolExecutor(max_workers=len(getters)) as executor:
+        for future in [executor.submit(getter) for getter in getters]:
+            future.result()
+
+
+# Stylesheet for the interface, read once at import
+with open(os.path.join(os.path.dirname(__file__), "static", "app.css"), encoding="utf-8") as _css_file:
+    APP_CSS = _css_file.read()
+
+# ATS feedback lines containing any of these words get a check mark
+_GOOD_RE = re.compile(r"(?i)excellent|good|great|strong")
+
+# Analysis results are deterministic in their input text, so repeated clicks
+# on the same resume / job description are served from these caches.
+_resume_info_cache = LRUCache(maxsize=256)
+_ats_cache = LRUCache(maxsize=256)
+_similarity_cache = LRUCache(maxsize=256)
+
+# Users often retry several resumes against one job description, so the
+# JD side (skills and embedding) is kept for an hour.
+_jd_skills_cache = LRUCache(maxsize=128, ttl=3600)
+_jd_embedding_cache = LRUCache(maxsize=128, ttl=3600)
+
+
+def cached_resume_info(resume_text: str) -> Dict:
+    """Run NLPProcessor.extract_all, cached by resume content hash."""
+    return _resume_info_cache.get_or_set(
+        text_hash(resume_text),
+        lambda: get_nlp_processor().extract_all(resume_text)
+    )
+
+
+def cached_jd_skills(job_description: str) -> Dict[str, List[str]]:
+    """Run NLPProcessor.extract_skills on a job description, cached by content hash."""
+    return _jd_skills_cache.get_or_set(
+        text_hash(job_description),
+        lambda: get_nlp_processor().extract_skills(job_description)
+    )
+
+
+def cached_jd_embedding(job_description: str):
+    """Run JobMatcher.encode_text on a job description, cached by content hash."""
+    return _jd_embedding_cache.get_or_set(
+        text_hash(job_description),
+        lambda: get_job_matcher().encode_text(job_description)
+    )
+
+
+def cached_ats_score(resume_text: str, job_description: str = "") -> Dict:
+    """Run ATSScorer.calculate_score, cached by (resume, JD) content hash."""
+    key = (text_hash(resume_text), text_hash(job_description or ""))
+    return _ats_cache.get_or_set(
+        key,
+        lambda: get_ats_scorer().calculate_score(resume_text, job_description)
+    )
+
+
+def cached_similarity(
+    resume_text: str,
+    job_description: str,
+    job_embedding=None
+) -> float:
+    """Run JobMatcher.calculate_similarity, cached by (resume, JD) content hash."""
+    key = (text_hash(resume_text), text_hash(job_description))
+    return _similarity_cache.get_or_set(
+        key,
+        lambda: get_job_matcher().calculate_similarity(
+            resume_text, job_description, job_embedding=job_embedding
+        )
+    )
+
+
+def warmup_components():
+    """
+    Run a dummy analysis so model loading and kernel initialization
+    happen at startup instead of on the first user request.
+    """
+    try:
+        import torch
+        torch.set_num_threads(os.cpu_count() or 1)
+    except ImportError:
+        pass
+    
+    preload_components()
+    logger.info("Warming up components...")
+    warmup_text = "John Doe Python engineer 5 years experience 2018 2023"
+    get_nlp_processor().extract_all(warmup_text)
+    get_job_matcher().calculate_similarity(warmup_text, warmup_text)
+    get_ats_scorer().calculate_score(warmup_text, "")
+    logger.info("Warmup complete")
+
+
+@functools.cache
+def get_cpu_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Return the executor used for CPU-bound analysis stages.
+    
+    Setting RA_PROCESS_WORKERS to a positive number runs the stages in a
+    process pool, which sidesteps the GIL for the pure-Python NLP work.
+    Each worker process loads its own models and keeps its own caches.
+    By default stages run in the event loop's thread pool.
+    """
+    workers = int(os.getenv('RA_PROCESS_WORKERS', '0'))
+    if workers > 0:
+        logger.info(f"Running analysis stages in {workers} worker processes")
+        return ProcessPoolExecutor(max_workers=workers)
+    return None
+
+
+async def _run_cpu(func, *args):
+    """Run a CPU-bound stage off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_cpu_executor(), func, *args)
+
+
+# Module-level stage functions, so they can be dispatched to worker processes
+def _parse_resume(file_path: str) -> Dict:
+    """Parse an uploaded resume file."""
+    return get_resume_parser().parse_file(file_path)
+
+
+def _analyze_skill_match(resume_skills: List[str], required_skills: List[str]) -> Dict:
+    """Compare resume skills against required skills."""
+    return get_job_matcher().analyze_skill_match(resume_skills, required_skills)
+
+
+def _generate_recommendations(
+    resume_text: str,
+    job_description: str,
+    resume_skills: List[str]
+) -> List[str]:
+    """Generate job-specific resume recommendations."""
+    return get_job_matcher().generate_recommendations(
+        resume_text, job_description, resume_skills
+    )
+
+
+def _suggest_jobs(resume_text: str) -> List[Dict]:
+    """Find the best matching roles from the job database."""
+    return get_job_matcher().match_indexed_jobs(resume_text, top_k=3)
+
+
+def _pending_html(message: str) -> str:
+    """Placeholder shown in a results panel while its stage is running."""
+    return f"""
+<div style="text-align: center; padding: 40px 20px; background: #f8f9fa; border-radius: 12px; color: #666;">
+    <div style="font-size: 32px; margin-bottom: 10px;">⏳</div>
+    <p style="margin: 0; font-size: 16px;">{message}…</p>
+</div>
+"""
+
+
+async def analyze_resume(
     resume_file,
-    job_description: str = ""
-) -> Tuple[str, str, str, str, str]:
+    job_description: str = "",
+    progress=gr.Progress()
+) -> AsyncIterator[Tuple[str, str, str, str, str]]:
     """
     Main analysis function for Gradio interface.
     
+    Results are streamed: a partial tuple is yielded as each stage
+    finishes, so the overview renders before the slower job matching.
+    CPU-bound stages run in an executor (see get_cpu_executor) so the
+    event loop stays free to serve other requests meanwhile.
+    
     Args:
         resume_file: Uploaded resume file
         job_description: Optional job description
+        progress: Gradio progress tracker, injected by the queue
         
-    Returns:
+    Yields:
         Tuple of (overview, ats_results, skills_results, job_match, recommendations)
     """
     try:
         if resume_file is None:
-            return "⚠️ Please upload a resume file", "", "", "", ""
+            yield "⚠️ Please upload a resume file", "", "", "", ""
+            return
+        
+        # Gradio passes a path string for type="filepath" uploads
+        file_path = getattr(resume_file, "name", resume_file)
         
-        # Parse resume
-        logger.info(f"Processing: {resume_file.name}")
-        parsed_data = resume_parser.parse_file(resume_file.name)
+        # Reject oversized or unsupported uploads before any parsing work
+        try:
+            validate_file_upload(file_path)
+        except (FileNotFoundError, ValueError) as e:
+            yield f"⚠️ {e}", "", "", "", ""
+            return
+        
+        has_job_description = bool(job_description and job_description.strip())
+        
+        # Parse resume, encoding the job description in parallel since the
+        # two share no data
+        logger.info(f"Processing: {file_path}")
+        progress(0.1, desc="Parsing resume")
+        if has_job_description:
+            parsed_data, job_embedding = await asyncio.gather(
+                _run_cpu(_parse_resume, file_path),
+                _run_cpu(cached_jd_embedding, job_description)
+            )
+        else:
+            parsed_data = await _run_cpu(_parse_resume, file_path)
+            job_embedding = None
         resume_text = parsed_data['cleaned_text']
         
         # Extract information
-        skills = nlp_processor.extract_skills(resume_text)
-        experience_years = nlp_processor.calculate_experience_years(resume_text)
-        experiences = nlp_processor.extract_experience(resume_text)
-        education = nlp_processor.extract_education(resume_text)
+        progress(0.3, desc="Extracting skills and experience")
+        resume_info = await _run_cpu(cached_resume_info, resume_text)
+        skills = resume_info['skills']
+        experience_years = resume_info['experience_years']
+        experiences = resume_info['experiences']
+        education = resume_info['education']
+        all_resume_skills = list(itertools.chain.from_iterable(skills.values()))
+        total_skills = len(all_resume_skills)
         
-        # Calculate ATS score
-        ats_results = ats_scorer.calculate_score(resume_text, job_description)
+        # Build overview
+        overview = TEMPLATES["overview"].render(
+            file_name=os.path.basename(file_path),
+            word_count=parsed_data['word_count'],
+            experience_years=experience_years,
+            total_skills=total_skills,
+            metadata=parsed_data['metadata']
+        )
         
-        # Build overview with better formatting
-        overview = f"""
-<div style="padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 12px; color: white; margin-bottom: 20px;">
-    <h1 style="margin: 0; font-size: 28px;">📄 Resume Analysis Complete</h1>
-</div>
-
-<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin: 20px 0;">
-    <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; border-left: 4px solid #667eea;">
-        <h3 style="margin: 0 0 10px 0; color: #667eea;">📋 File Info</h3>
-        <p style="margin: 5px 0;"><strong>Name:</strong> {os.path.basename(resume_file.name)}</p>
-        <p style="margin: 5px 0;"><strong>Words:</strong> {parsed_data['word_count']}</p>
-    </div>
-    
-    <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; border-left: 4px solid #28a745;">
-        <h3 style="margin: 0 0 10px 0; color: #28a745;">💼 Experience</h3>
-        <p style="margin: 5px 0; font-size: 24px; font-weight: bold;">{experience_years} years</p>
-    </div>
-    
-    <div style="background: #f8f9fa; padding: 20px; border-radius: 10px; border-left: 4px solid #ffc107;">
-        <h3 style="margin: 0 0 10px 0; color: #ffc107;">🎯 Skills Found</h3>
-        <p style="margin: 5px 0; font-size: 24px; font-weight: bold;">{sum(len(s) for s in skills.values())}</p>
-    </div>
-</div>
-
-<div style="background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin: 20px 0;">
-    <h3 style="color: #333; margin-top: 0;">📧 Contact Information</h3>
-"""
-        if parsed_data['metadata'].get('emails'):
-            overview += f"<p>✉️ <strong>Email:</strong> {parsed_data['metadata']['emails'][0]}</p>"
-        if parsed_data['metadata'].get('phones'):
-            overview += f"<p>📱 <strong>Phone:</strong> {parsed_data['metadata']['phones'][0]}</p>"
-        if parsed_data['metadata'].get('linkedin'):
-            overview += f"<p>💼 <strong>LinkedIn:</strong> {parsed_data['metadata']['linkedin']}</p>"
+        yield overview, _pending_html("Scoring ATS compatibility"), "", "", ""
         
-        overview += "</div>"
+        # Calculate ATS score
+        progress(0.5, desc="Scoring ATS compatibility")
+        ats_results = await _run_cpu(cached_ats_score, resume_text, job_description)
         
-        # ATS Score Display with better visuals
+        # ATS Score Display
         score_color = "#28a745" if ats_results['overall_score'] >= 80 else "#ffc107" if ats_results['overall_score'] >= 60 else "#dc3545"
         
-        ats_display = f"""
-<div style="padding: 20px; background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); border-radius: 12px; color: white; margin-bottom: 20px;">
-    <h1 style="margin: 0; font-size: 28px;">🎯 ATS Compatibility Analysis</h1>
-</div>
-
-<div style="text-align: center; padding: 30px; background: white; border-radius: 12px; box-shadow: 0 4px 12px rgba(0,0,0,0.15); margin: 20px 0;">
-    <div style="display: inline-block; position: relative; width: 180px; height: 180px;">
-        <svg width="180" height="180" style="transform: rotate(-90deg);">
-            <circle cx="90" cy="90" r="70" fill="none" stroke="#e0e0e0" stroke-width="20"/>
-            <circle cx="90" cy="90" r="70" fill="none" stroke="{score_color}" stroke-width="20"
-                    stroke-dasharray="440" stroke-dashoffset="{440 - (440 * ats_results['overall_score'] / 100)}"
-                    stroke-linecap="round"/>
-        </svg>
-        <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); text-align: center;">
-            <div style="font-size: 42px; font-weight: bold; color: {score_color};">{ats_results['overall_score']}</div>
-            <div style="font-size: 14px; color: #666;">out of 100</div>
-        </div>
-    </div>
-    <h2 style="margin: 20px 0 10px 0; color: {score_color};">Grade: {ats_results['grade']}</h2>
-</div>
-
-<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 30px 0;">
-"""
-        
         colors = ['#667eea', '#28a745', '#ffc107', '#17a2b8', '#6c757d']
-        for idx, (category, data) in enumerate(ats_results['category_scores'].items()):
-            category_name = category.replace('_', ' ').title()
-            color = colors[idx % len(colors)]
-            ats_display += f"""
-    <div style="background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); border-top: 4px solid {color};">
-        <h3 style="margin: 0 0 10px 0; color: {color};">{category_name}</h3>
-        <div style="font-size: 28px; font-weight: bold; color: #333; margin: 10px 0;">{data['score']:.0f}/100</div>
-        <div style="background: #f0f0f0; height: 8px; border-radius: 4px; overflow: hidden; margin: 10px 0;">
-            <div style="background: {color}; height: 100%; width: {data['score']}%; transition: width 0.3s;"></div>
-        </div>
-    </div>
-"""
-        
-        ats_display += "</div>"
+        categories = [
+            {
+                'name': category.replace('_', ' ').title(),
+                'color': colors[idx % len(colors)],
+                'score': data['score']
+            }
+            for idx, (category, data) in enumerate(ats_results['category_scores'].items())
+        ]
+        feedback = [
+            {
+                'icon': "✅" if _GOOD_RE.search(item) else "⚠️",
+                'text': item
+            }
+            for item in ats_results['feedback'][:5]
+        ]
         
-        ats_display += """
-<div style="background: #f8f9fa; padding: 25px; border-radius: 10px; margin: 20px 0;">
-    <h3 style="color: #333; margin-top: 0;">💡 Key Recommendations</h3>
-    <ul style="list-style: none; padding: 0;">
-"""
-        for feedback in ats_results['feedback'][:5]:
-            icon = "✅" if "Excellent" in feedback or "good" in feedback.lower() else "⚠️"
-            ats_display += f"<li style='padding: 8px 0; border-bottom: 1px solid #dee2e6;'>{icon} {feedback}</li>"
+        ats_display = TEMPLATES["ats"].render(
+            score_color=score_color,
+            overall_score=ats_results['overall_score'],
+            grade=ats_results['grade'],
+            categories=categories,
+            feedback=feedback
+        )
         
-        ats_display += "</ul></div>"
+        yield overview, ats_display, _pending_html("Building skills portfolio"), "", ""
         
         # Skills Display with badges
-        skills_display = f"""
-<div style="padding: 20px; background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); border-radius: 12px; color: white; margin-bottom: 20px;">
-    <h1 style="margin: 0; font-size: 28px;">🎯 Skills Portfolio</h1>
-    <p style="margin: 10px 0 0 0; opacity: 0.9;">Total: {sum(len(s) for s in skills.values())} skills identified</p>
-</div>
-"""
+        skill_colors = {
+            'programming': '#667eea',
+            'web': '#28a745',
+            'data_science': '#ff6b6b',
+            'cloud': '#4ecdc4',
+            'database': '#ffc107',
+            'tools': '#95e1d3',
+            'soft_skills': '#c44569'
+        }
+        skills_display = TEMPLATES["skills"].render(
+            total_skills=total_skills,
+            categories=[
+                {
+                    'name': category.replace('_', ' ').title(),
+                    'color': skill_colors.get(category, '#6c757d'),
+                    'skills': skill_list
+                }
+                for category, skill_list in skills.items()
+            ]
+        )
         
-        if skills:
-            skill_colors = {
-                'programming': '#667eea',
-                'web': '#28a745',
-                'data_science': '#ff6b6b',
-                'cloud': '#4ecdc4',
-                'database': '#ffc107',
-                'tools': '#95e1d3',
-                'soft_skills': '#c44569'
-            }
+        # Job Matching
+        if has_job_description:
+            yield (
+                overview,
+                ats_display,
+                skills_display,
+                _pending_html("Matching against job description"),
+                _pending_html("Generating recommendations")
+            )
             
-            for category, skill_list in skills.items():
-                category_name = category.replace('_', ' ').title()
-                color = skill_colors.get(category, '#6c757d')
-                
-                skills_display += f"""
-<div style="background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin: 15px 0;">
-    <h3 style="color: {color}; margin: 0 0 15px 0; padding-bottom: 10px; border-bottom: 2px solid {color};">
-        {category_name} ({len(skill_list)})
-    </h3>
-    <div style="display: flex; flex-wrap: wrap; gap: 8px;">
-"""
-                for skill in skill_list:
-                    skills_display += f"""
-        <span style="background: {color}; color: white; padding: 6px 14px; border-radius: 20px; font-size: 13px; font-weight: 500;">
-            {skill}
-        </span>
-"""
-                skills_display += "</div></div>"
-        else:
-            skills_display += "<p>No specific skills detected. Consider adding a dedicated skills section.</p>"
-        
-        # Job Matching with better design
-        job_match_display = ""
-        recommendations_display = ""
-        
-        if job_description and job_description.strip():
-            similarity = job_matcher.calculate_similarity(resume_text, job_description)
+            progress(0.7, desc="Matching against job description")
+            similarity = await _run_cpu(
+                cached_similarity, resume_text, job_description, job_embedding
+            )
             
-            jd_skills = nlp_processor.extract_skills(job_description)
-            all_resume_skills = [skill for skills_list in skills.values() for skill in skills_list]
-            all_jd_skills = [skill for skills_list in jd_skills.values() for skill in skills_list]
+            jd_skills = await _run_cpu(cached_jd_skills, job_description)
+            all_jd_skills = list(itertools.chain.from_iterable(jd_skills.values()))
             
-            skill_gap = job_matcher.analyze_skill_match(all_resume_skills, all_jd_skills)
+            skill_gap = await _run_cpu(_analyze_skill_match, all_resume_skills, all_jd_skills)
             
             match_color = "#28a745" if similarity >= 0.7 else "#ffc107" if similarity >= 0.5 else "#dc3545"
             
-            job_match_display = f"""
-<div style="padding: 20px; background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); border-radius: 12px; color: white; margin-bottom: 20px;">
-    <h1 style="margin: 0; font-size: 28px;">🎯 Job Match Analysis</h1>
-</div>
-
-<div style="text-align: center; padding: 30px; background: white; border-radius: 12px; box-shadow: 0 4px 12px rgba(0,0,0,0.15); margin: 20px 0;">
-    <h2 style="color: #333; margin: 0 0 20px 0;">Match Score</h2>
-    <div style="font-size: 52px; font-weight: bold; color: {match_color}; margin: 10px 0;">{similarity * 100:.1f}%</div>
-    <p style="color: #666; margin: 10px 0;">Semantic Similarity</p>
-</div>
-
-<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 20px 0;">
-    <div style="background: #d4edda; padding: 20px; border-radius: 10px; border-left: 5px solid #28a745;">
-        <h3 style="color: #28a745; margin: 0 0 15px 0;">✅ Matching Skills ({len(skill_gap['matching_skills'])})</h3>
-        <div style="max-height: 200px; overflow-y: auto;">
-"""
-            if skill_gap['matching_skills']:
-                for skill in skill_gap['matching_skills'][:15]:
-                    job_match_display += f"<span style='display: inline-block; background: #28a745; color: white; padding: 4px 10px; border-radius: 15px; margin: 4px; font-size: 12px;'>{skill}</span>"
-            else:
-                job_match_display += "<p>None found</p>"
-            
-            job_match_display += f"""
-        </div>
-    </div>
-    
-    <div style="background: #f8d7da; padding: 20px; border-radius: 10px; border-left: 5px solid #dc3545;">
-        <h3 style="color: #dc3545; margin: 0 0 15px 0;">❌ Missing Skills ({len(skill_gap['missing_skills'])})</h3>
-        <div style="max-height: 200px; overflow-y: auto;">
-"""
-            if skill_gap['missing_skills']:
-                for skill in skill_gap['missing_skills'][:15]:
-                    job_match_display += f"<span style='display: inline-block; background: #dc3545; color: white; padding: 4px 10px; border-radius: 15px; margin: 4px; font-size: 12px;'>{skill}</span>"
-            else:
-                job_match_display += "<p>All required skills matched!</p>"
-            
-            job_match_display += f"""
-        </div>
-    </div>
-</div>
-
-<div style="background: white; padding: 25px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin: 20px 0;">
-    <h3 style="color: #333; margin: 0 0 15px 0;">📊 Skill Coverage</h3>
-    <div style="background: #e9ecef; height: 30px; border-radius: 15px; overflow: hidden; position: relative;">
-        <div style="background: linear-gradient(90deg, #667eea 0%, #764ba2 100%); height: 100%; width: {skill_gap['match_percentage']}%; transition: width 0.5s; display: flex; align-items: center; justify-content: center; color: white; font-weight: bold;">
-            {skill_gap['match_percentage']:.1f}%
-        </div>
-    </div>
-    <p style="color: #666; margin: 10px 0 0 0; font-size: 14px;">
-        {skill_gap['total_matched']} out of {skill_gap['total_required']} required skills found
-    </p>
-</div>
-"""
+            job_match_display = TEMPLATES["job_match"].render(
+                has_job_description=True,
+                similarity=similarity,
+                match_color=match_color,
+                skill_gap=skill_gap
+            )
             
-            recommendations = job_matcher.generate_recommendations(
-                resume_text, job_description, all_resume_skills
+            recommendations = await _run_cpu(
+                _generate_recommendations, resume_text, job_description, all_resume_skills
             )
             
-            recommendations_display = """
-<div style="padding: 20px; background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); border-radius: 12px; color: white; margin-bottom: 20px;">
-    <h1 style="margin: 0; font-size: 28px;">💡 Personalized Recommendations</h1>
-</div>
-
-<div style="background: white; padding: 25px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-"""
-            for i, rec in enumerate(recommendations, 1):
-                recommendations_display += f"""
-    <div style="padding: 15px; margin: 10px 0; background: #f8f9fa; border-left: 4px solid #4facfe; border-radius: 5px;">
-        <strong style="color: #4facfe;">{i}.</strong> {rec}
-    </div>
-"""
-            recommendations_display += "</div>"
+            recommendations_display = TEMPLATES["recommendations"].render(
+                has_job_description=True,
+                recommendations=recommendations
+            )
             
             log_analysis(
-                os.path.basename(resume_file.name),
+                os.path.basename(file_path),
                 ats_results['overall_score'],
                 similarity
             )
         else:
-            job_match_display = """
-<div style="text-align: center; padding: 60px 20px; background: white; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-    <div style="font-size: 64px; margin-bottom: 20px;">📝</div>
-    <h2 style="color: #333; margin: 10px 0;">No Job Description Provided</h2>
-    <p style="color: #666; max-width: 500px; margin: 15px auto;">
-        Paste a job description above to get personalized matching insights including:
-    </p>
-    <ul style="list-style: none; padding: 0; color: #666; margin: 20px 0;">
-        <li>✅ Match percentage</li>
-        <li>📊 Skill gap analysis</li>
-        <li>❌ Missing skills</li>
-        <li>💡 Tailored recommendations</li>
-    </ul>
-</div>
-"""
-            recommendations_display = """
-<div style="padding: 25px; background: white; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-    <h3 style="color: #333; margin: 0 0 20px 0;">💡 General Best Practices</h3>
-    <div style="padding: 15px; margin: 10px 0; background: #f8f9fa; border-left: 4px solid #667eea; border-radius: 5px;">
-        <strong>1.</strong> Add a job description above for personalized recommendations
-    </div>
-    <div style="padding: 15px; margin: 10px 0; background: #f8f9fa; border-left: 4px solid #28a745; border-radius: 5px;">
-        <strong>2.</strong> Ensure your resume has clear sections (Experience, Education, Skills)
-    </div>
-    <div style="padding: 15px; margin: 10px 0; background: #f8f9fa; border-left: 4px solid #ffc107; border-radius: 5px;">
-        <strong>3.</strong> Use action verbs and quantifiable achievements
-    </div>
-    <div style="padding: 15px; margin: 10px 0; background: #f8f9fa; border-left: 4px solid #17a2b8; border-radius: 5px;">
-        <strong>4.</strong> Keep formatting simple and ATS-friendly
-    </div>
-</div>
-"""
+            suggested_jobs = await _run_cpu(_suggest_jobs, resume_text)
+            job_match_display = TEMPLATES["job_match"].render(
+                has_job_description=False,
+                suggested_jobs=suggested_jobs
+            )
+            recommendations_display = TEMPLATES["recommendations"].render(has_job_description=False)
         
-        return (
+        yield (
             overview,
             ats_display,
             skills_display,
@@ -344,142 +443,95 @@ def analyze_resume(
     <p style="margin-top: 15px; font-size: 14px;">Please try again with a different file or contact support.</p>
 </div>
 """
-        return error_msg, "", "", "", ""
+        yield error_msg, "", "", "", ""
 
 
-def create_interface():
-    """Create and configure Gradio interface."""
-    
-    # Commercial-Grade CSS
-    custom_css = """
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-    
-    * {
-        font-family: 'Inter', sans-serif !important;
-    }
-    
-    body {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-    }
-    
-    .gradio-container {
-        max-width: 1400px !important;
-        margin: auto !important;
-        padding: 20px !important;
-    }
-    
-    .gr-button-primary {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        border: none !important;
-        font-weight: 700 !important;
-        padding: 16px 48px !important;
-        font-size: 18px !important;
-        border-radius: 50px !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.4) !important;
-        text-transform: none !important;
-    }
-    
-    .gr-button-primary:hover {
-        transform: translateY(-3px) !important;
-        box-shadow: 0 12px 30px rgba(102, 126, 234, 0.6) !important;
-    }
-    
-    .gr-box {
-        border-radius: 16px !important;
-        border: none !important;
-        box-shadow: 0 8px 20px rgba(0, 0, 0, 0.1) !important;
-        background: white !important;
-    }
-    
-    .gr-input, .gr-textarea {
-        border-radius: 12px !important;
-        border: 2px solid #e0e0e0 !important;
-        transition: all 0.3s !important;
-        font-size: 15px !important;
-        padding: 12px !important;
-    }
-    
-    .gr-input:focus, .gr-textarea:focus {
-        border-color: #667eea !important;
-        box-shadow: 0 0 0 4px rgba(102, 126, 234, 0.15) !important;
-        outline: none !important;
-    }
-    
-    .gr-panel {
-        border: none !important;
-        background: white !important;
-        border-radius: 16px !important;
-    }
-    
-    .gr-form {
-        background: white !important;
-        border-radius: 16px !important;
-        padding: 25px !important;
-        box-shadow: 0 8px 20px rgba(0, 0, 0, 0.1) !important;
-    }
-    
-    h1, h2, h3 {
-        font-weight: 700 !important;
-    }
-    
-    .tabs {
-        border-radius: 16px !important;
-        overflow: hidden !important;
-        box-shadow: 0 8px 20px rgba(0, 0, 0, 0.1) !important;
-        background: white !important;
-    }
-    
-    .tab-nav {
-        background: #f8f9fa !important;
-        padding: 10px !important;
-        border-radius: 12px 12px 0 0 !important;
-    }
-    
-    .tab-nav button {
-        font-weight: 600 !important;
-        font-size: 15px !important;
-        padding: 12px 24px !important;
-        border-radius: 8px !important;
-        transition: all 0.3s !important;
-    }
-    
-    .tab-nav button:hover {
-        background: rgba(102, 126, 234, 0.1) !important;
-    }
-    
-    .tab-nav button[aria-selected="true"] {
-        background: white !important;
-        border-bottom: 3px solid #667eea !important;
-        color: #667eea !important;
-    }
-    
-    .gr-file {
-        border: 3px dashed #667eea !important;
-        border-radius: 16px !important;
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%) !important;
-        padding: 30px !important;
-        transition: all 0.3s !important;
-    }
-    
-    .gr-file:hover {
-        transform: translateY(-5px) !important;
-        box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3) !important;
-    }
+def _parse_for_batch(file_path: str) -> Optional[Dict]:
+    """Parse one resume of a batch, returning None if it cannot be parsed."""
+    try:
+        validate_file_upload(file_path)
+        return get_resume_parser().parse_file(file_path)
+    except Exception as e:
+        logger.warning(f"Skipping {file_path} in batch: {e}")
+        return None
+
+
+def analyze_batch(resume_files, job_description: str = "") -> str:
+    """
+    Rank several resumes at once for the Gradio batch screening panel.
     
-    label {
-        font-weight: 600 !important;
-        color: #333 !important;
-        font-size: 16px !important;
-        margin-bottom: 8px !important;
-    }
+    Files are parsed concurrently and, when a job description is given,
+    all resumes are encoded in a single batched call.
     
-    .gr-compact {
-        gap: 20px !important;
-    }
+    Args:
+        resume_files: List of uploaded resume files
+        job_description: Optional job description
+        
+    Returns:
+        HTML table ranking the resumes
     """
+    try:
+        if not resume_files:
+            return "⚠️ Please upload one or more resume files"
+        
+        file_paths = [getattr(f, "name", f) for f in resume_files]
+        logger.info(f"Batch processing {len(file_paths)} resumes")
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            parsed_results = list(executor.map(_parse_for_batch, file_paths))
+        
+        rows = []
+        failed = []
+        for file_path, parsed_data in zip(file_paths, parsed_results):
+            if parsed_data is None:
+                failed.append(os.path.basename(file_path))
+                continue
+            resume_text = parsed_data['cleaned_text']
+            skills = cached_resume_info(resume_text)['skills']
+            ats_results = cached_ats_score(resume_text, job_description)
+            rows.append({
+                'name': os.path.basename(file_path),
+                'text': resume_text,
+                'skills': sum(len(s) for s in skills.values()),
+                'ats_score': ats_results['overall_score'],
+                'grade': ats_results['grade'],
+                'similarity': None
+            })
+        
+        has_jd = bool(job_description and job_description.strip())
+        if has_jd and rows:
+            similarities = get_job_matcher().calculate_similarities(
+                [row['text'] for row in rows], job_description
+            )
+            for row, similarity in zip(rows, similarities):
+                row['similarity'] = similarity
+            rows.sort(key=lambda row: row['similarity'], reverse=True)
+        else:
+            rows.sort(key=lambda row: row['ats_score'], reverse=True)
+        
+        for row in rows:
+            log_analysis(row['name'], row['ats_score'], row['similarity'])
+        
+        return TEMPLATES["batch"].render(
+            rows=rows,
+            has_job_description=has_jd,
+            failed=failed
+        )
+        
+    except Exception as e:
+        logger.error(f"Batch analysis failed: {e}", exc_info=True)
+        return f"""
+<div style="padding: 30px; background: #f8d7da; border-radius: 10px; border-left: 5px solid #dc3545; color: #721c24;">
+    <h3 style="margin: 0 0 15px 0;">❌ Error</h3>
+    <p>{str(e)}</p>
+</div>
+"""
+
+
+def create_interface():
+    """Create and configure Gradio interface."""
     
-    with gr.Blocks(css=custom_css, title="AI Resume Analyzer Pro", theme=gr.themes.Soft()) as demo:
+    with gr.Blocks(css=APP_CSS, title="AI Resume Analyzer Pro", theme=gr.themes.Soft()) as demo:
         gr.HTML("""
         <div style="text-align: center; padding: 60px 20px; background: rgba(255, 255, 255, 0.95); border-radius: 24px; margin-bottom: 30px; box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);">
             <div style="font-size: 64px; margin-bottom: 20px;">🚀</div>
@@ -569,6 +621,9 @@ def create_interface():
             with gr.Tab("💡 Recommendations"):
                 recommendations_output = gr.HTML()
         
+        # Load models when the first page is opened, if not done at startup
+        demo.load(fn=preload_components)
+        
         # Set up event handler
         analyze_btn.click(
             fn=analyze_resume,
@@ -579,7 +634,42 @@ def create_interface():
                 skills_output,
                 job_match_output,
                 recommendations_output
-            ]
+            ],
+            concurrency_limit=4,
+            show_progress="full"
+        )
+        
+        gr.HTML("""
+        <div style="margin: 40px 0;">
+            <div style="background: white; border-radius: 24px; padding: 40px; box-shadow: 0 20px 60px rgba(0, 0, 0, 0.15);">
+                <h2 style="text-align: center; color: #333; font-size: 32px; margin: 0;">📚 Batch Screening</h2>
+                <p style="text-align: center; color: #666; margin: 15px 0 0 0;">Rank multiple resumes against the job description above</p>
+            </div>
+        </div>
+        """)
+        
+        with gr.Row():
+            with gr.Column(scale=2):
+                batch_input = gr.File(
+                    label="📚 Drop Multiple Resumes Here",
+                    file_types=[".pdf", ".docx", ".txt"],
+                    file_count="multiple",
+                    type="filepath"
+                )
+                
+                batch_btn = gr.Button(
+                    "📊 Rank Resumes",
+                    variant="primary",
+                    size="lg"
+                )
+        
+        batch_output = gr.HTML()
+        
+        batch_btn.click(
+            fn=analyze_batch,
+            inputs=[batch_input, job_desc_input],
+            outputs=[batch_output],
+            concurrency_limit=2
         )
         
         gr.HTML("""
@@ -614,14 +704,26 @@ def create_interface():
         </div>
         """)
     
+    # Queue requests so concurrent uploads are processed by a bounded
+    # worker pool instead of blocking each other
+    demo.queue(default_concurrency_limit=4, max_size=32)
+    
     return demo
 
 
 if __name__ == "__main__":
     logger.info("Starting Gradio application...")
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    warmup_components()
     demo = create_interface()
     demo.launch(
         server_name="0.0.0.0",
         server_port=7860,
-        share=False
+        share=False,
+        max_threads=40
     )
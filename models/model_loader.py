@@ -5,7 +5,9 @@ Handles loading and caching of AI models.
 
 import os
 import logging
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple
 from sentence_transformers import SentenceTransformer
 import spacy
 
@@ -19,6 +21,8 @@ class ModelLoader:
     
     _instance = None
     _models = {}
+    _lock = threading.Lock()
+    _key_locks = {}
     
     def __new__(cls):
         if cls._instance is None:
@@ -30,56 +34,131 @@ class ModelLoader:
         self.cache_dir = os.getenv('MODEL_CACHE_DIR', './model_cache')
         os.makedirs(self.cache_dir, exist_ok=True)
     
+    def _get_or_load(self, key: str, load: Callable):
+        """
+        Return the cached model under key, loading it at most once.
+        
+        Each key has its own lock, so different models can load in
+        parallel while concurrent requests for the same one wait for it.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            if key in self._models:
+                logger.info(f"Using cached model: {key}")
+                return self._models[key]
+            model = load()
+            if model is not None:
+                self._models[key] = model
+            return model
+    
+    def preload(self, specs: List[Tuple[str, str]]):
+        """
+        Load several models concurrently.
+        
+        Model loading is dominated by disk/network I/O and native code
+        that releases the GIL, so startup takes about as long as the
+        slowest model instead of the sum of all of them.
+        
+        Args:
+            specs: (kind, model_name) pairs, kind being 'st' or 'spacy'
+        """
+        loaders = {
+            'st': self.load_sentence_transformer,
+            'spacy': self.load_spacy_model
+        }
+        if not specs:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+            futures = {
+                executor.submit(loaders[kind], name): (kind, name)
+                for kind, name in specs
+            }
+            for future in as_completed(futures):
+                kind, name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Preloading {kind} model {name} failed: {e}")
+    
     def load_sentence_transformer(
         self, 
-        model_name: str = "all-MiniLM-L6-v2"
+        model_name: str = "all-MiniLM-L6-v2",
+        quantize: bool = False
     ) -> SentenceTransformer:
         """
         Load sentence transformer model with caching.
         
         Args:
             model_name: HuggingFace model name
+            quantize: Apply int8 dynamic quantization to the Linear layers
+                (CPU inference only)
             
         Returns:
             Loaded model
         """
-        if model_name in self._models:
-            logger.info(f"Using cached model: {model_name}")
-            return self._models[model_name]
+        key = f"{model_name}[int8]" if quantize else model_name
         
-        try:
-            logger.info(f"Loading sentence transformer: {model_name}")
-            model = SentenceTransformer(model_name, cache_folder=self.cache_dir)
-            self._models[model_name] = model
-            logger.info(f"Successfully loaded: {model_name}")
-            return model
-        except Exception as e:
-            logger.error(f"Failed to load model {model_name}: {e}")
-            raise
+        def load():
+            try:
+                logger.info(f"Loading sentence transformer: {key}")
+                model = SentenceTransformer(model_name, cache_folder=self.cache_dir)
+                if quantize:
+                    import torch
+                    transformer = model[0]
+                    transformer.auto_model = torch.quantization.quantize_dynamic(
+                        transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                logger.info(f"Successfully loaded: {key}")
+                return model
+            except Exception as e:
+                logger.error(f"Failed to load model {model_name}: {e}")
+                raise
+        
+        return self._get_or_load(key, load)
     
-    def load_spacy_model(self, model_name: str = "en_core_web_sm"):
+    def load_spacy_model(
+        self,
+        model_name: str = "en_core_web_sm",
+        exclude: Optional[List[str]] = None,
+        disable: Optional[List[str]] = None
+    ):
         """
         Load spaCy model with caching.
         
+        Each distinct (model_name, exclude, disable) combination is cached
+        separately.
+        
         Args:
             model_name: spaCy model name
+            exclude: Pipeline components not to load at all
+            disable: Pipeline components to load but not run (can be
+                re-enabled with nlp.enable_pipe)
             
         Returns:
             Loaded spaCy model
         """
-        if model_name in self._models:
-            logger.info(f"Using cached spaCy model: {model_name}")
-            return self._models[model_name]
+        exclude = sorted(exclude or [])
+        disable = sorted(disable or [])
+        key = model_name
+        if exclude:
+            key += f"[-{','.join(exclude)}]"
+        if disable:
+            key += f"[~{','.join(disable)}]"
+        
+        def load():
+            try:
+                logger.info(f"Loading spaCy model: {key}")
+                nlp = spacy.load(model_name, exclude=exclude, disable=disable)
+                logger.info(f"Successfully loaded: {key}")
+                return nlp
+            except Exception as e:
+                logger.error(f"Failed to load spaCy model: {e}")
+                return None
         
-        try:
-            logger.info(f"Loading spaCy model: {model_name}")
-            nlp = spacy.load(model_name)
-            self._models[model_name] = nlp
-            logger.info(f"Successfully loaded: {model_name}")
-            return nlp
-        except Exception as e:
-            logger.error(f"Failed to load spaCy model: {e}")
-            return None
+        return self._get_or_load(key, load)
     
     def clear_cache(self):
         """Clear model cache."""
@@ -0,0 +1,158 @@
+"""
+ONNX Encoder Module
+Int8 ONNX Runtime replacement for SentenceTransformer.encode.
+"""
+
+import os
+import logging
+from typing import List, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+QUANTIZED_MODEL_FILE = "model-int8.onnx"
+
+
+class OnnxEncoder:
+    """
+    Mean-pooling sentence encoder backed by an int8 ONNX Runtime session.
+
+    Exposes the subset of SentenceTransformer.encode used by JobMatcher so
+    it can be swapped in without touching callers.
+    """
+
+    def __init__(
+        self,
+        model_dir: str,
+        model_file: str = QUANTIZED_MODEL_FILE,
+        max_length: int = 256,
+        normalize: bool = True
+    ):
+        """
+        Load tokenizer and ONNX session from an exported model directory.
+
+        Args:
+            model_dir: Directory created by export_quantized_model
+            model_file: ONNX file inside model_dir
+            max_length: Token limit per text (all-MiniLM-L6-v2 uses 256)
+            normalize: L2-normalize outputs, as the original model's
+                Normalize layer does
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, model_file),
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.max_length = max_length
+        self.normalize = normalize
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Generate embeddings for one text or a list of texts.
+
+        Args:
+            sentences: Input text or list of texts
+            batch_size: Number of texts per session run
+            normalize_embeddings: L2-normalize outputs
+            **kwargs: Ignored SentenceTransformer options
+                (convert_to_tensor, convert_to_numpy, ...)
+
+        Returns:
+            Embedding vector, or matrix of shape (len(sentences), dim)
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        # Batch texts of similar length together to minimize padding,
+        # as SentenceTransformer.encode does
+        order = np.argsort([-len(text) for text in texts], kind='stable')
+        sorted_texts = [texts[idx] for idx in order]
+
+        batches = []
+        for start in range(0, len(sorted_texts), batch_size):
+            batches.append(self._encode_batch(sorted_texts[start:start + batch_size]))
+        if not batches:
+            return np.empty((0, 0), dtype=np.float32)
+        sorted_embeddings = np.concatenate(batches)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+
+        if self.normalize or normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+        return embeddings[0] if single else embeddings
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Tokenize, run the session and mean-pool one batch."""
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np"
+        )
+        inputs = {
+            name: value.astype(np.int64)
+            for name, value in encoded.items()
+            if name in self.input_names
+        }
+        token_embeddings = self.session.run(None, inputs)[0]
+
+        # Mean pooling over non-padding tokens
+        mask = encoded["attention_mask"][..., None].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)
+        return (summed / counts).astype(np.float32)
+
+
+def export_quantized_model(
+    model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+    output_dir: str = "./onnx-miniLM"
+) -> str:
+    """
+    One-time export of a HuggingFace encoder to ONNX with int8 weights.
+
+    Requires optimum[onnxruntime]; only needed at build time.
+
+    Args:
+        model_name: HuggingFace model name
+        output_dir: Directory to write tokenizer and ONNX files to
+
+    Returns:
+        Path of the quantized ONNX model
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    from transformers import AutoTokenizer
+
+    logger.info(f"Exporting {model_name} to ONNX in {output_dir}")
+    ORTModelForFeatureExtraction.from_pretrained(model_name, export=True).save_pretrained(output_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(output_dir)
+
+    quantized_path = os.path.join(output_dir, QUANTIZED_MODEL_FILE)
+    quantize_dynamic(
+        os.path.join(output_dir, "model.onnx"),
+        quantized_path,
+        weight_type=QuantType.QInt8
+    )
+    logger.info(f"Saved int8 model: {quantized_path}")
+    return quantized_path
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    export_quantized_model(*sys.argv[1:3])
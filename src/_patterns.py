@@ -0,0 +1,17 @@
+"""
+Shared Patterns
+Compiled regexes used by more than one analysis module.
+"""
+
+import re
+
+# Action verbs that signal accomplishments, checked by ATSScorer and JobMatcher
+ACTION_VERBS = (
+    'led', 'managed', 'developed', 'created', 'implemented', 'designed',
+    'achieved', 'improved', 'increased', 'decreased', 'built'
+)
+
+ACTION_VERBS_RE = re.compile(
+    r'\b(?:' + '|'.join(ACTION_VERBS) + r')\b',
+    re.IGNORECASE
+)
@@ -7,6 +7,8 @@ import re
 from typing import Dict, List
 import logging
 
+from src._patterns import ACTION_VERBS_RE
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +28,20 @@ class ATSScorer:
         'objective', 'achievements', 'responsibilities', 'projects'
     ]
     
+    # Lowercase header forms looked for by _calculate_section_score
+    _SECTION_HEADERS = {
+        section: (f'\n{section}', f'{section}:') for section in ESSENTIAL_SECTIONS
+    }
+    
+    # Patterns used by the category scorers, compiled once
+    _SPECIAL_CHAR_RE = re.compile(r'[^\w\s\.,;:()\-@/]')
+    _WORD_RE = re.compile(r'\b\w+\b')
+    _NUMBER_RE = re.compile(r'\d+')
+    _EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    _PHONE_RE = re.compile(r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+    _LINKEDIN_RE = re.compile(r'linkedin\.com/in/')
+    _LOCATION_RE = re.compile(r',\s*[A-Z]{2}\b')
+    
     def __init__(self):
         """Initialize ATS scorer."""
         logger.info("ATSScorer initialized")
@@ -48,21 +64,22 @@ class ATSScorer:
             Dictionary with scores and breakdown
         """
         scores = {}
+        views = self._precompute(resume_text)
         
         # 1. Format Score (30%)
-        scores['format'] = self._calculate_format_score(resume_text)
+        scores['format'] = self._calculate_format_score(views)
         
         # 2. Section Completeness (25%)
-        scores['sections'] = self._calculate_section_score(resume_text)
+        scores['sections'] = self._calculate_section_score(views)
         
         # 3. Keyword Density (20%)
-        scores['keywords'] = self._calculate_keyword_score(resume_text, job_description)
+        scores['keywords'] = self._calculate_keyword_score(views, job_description)
         
         # 4. Content Quality (15%)
-        scores['content'] = self._calculate_content_score(resume_text)
+        scores['content'] = self._calculate_content_score(views)
         
         # 5. Contact Information (10%)
-        scores['contact'] = self._calculate_contact_score(resume_text)
+        scores['contact'] = self._calculate_contact_score(views)
         
         # Calculate weighted overall score
         weights = {
@@ -88,13 +105,34 @@ class ATSScorer:
             'grade': self._get_grade(overall_score)
         }
     
-    def _calculate_format_score(self, text: str) -> Dict:
+    def _precompute(self, text: str) -> Dict:
+        """
+        Build the views of the resume text shared by the category scorers.
+        
+        Args:
+            text: Resume content
+            
+        Returns:
+            Dictionary with the original 'text', its lowercase form 'lower',
+            the whitespace-separated 'word_count' and the 'word_set' of
+            lowercase \\w+ tokens
+        """
+        text_lower = text.lower()
+        return {
+            'text': text,
+            'lower': text_lower,
+            'word_count': len(text.split()),
+            'word_set': set(self._WORD_RE.findall(text_lower))
+        }
+    
+    def _calculate_format_score(self, views: Dict) -> Dict:
         """Calculate formatting score."""
+        text = views['text']
         score = 100
         issues = []
         
         # Check for special characters that confuse ATS
-        special_chars = len(re.findall(r'[^\w\s\.,;:()\-@/]', text))
+        special_chars = len(self._SPECIAL_CHAR_RE.findall(text))
         if special_chars > 50:
             score -= 15
             issues.append("Too many special characters")
@@ -104,9 +142,10 @@ class ATSScorer:
             score -= 10
             issues.append("Contains tabs (may indicate columns)")
         
-        # Check line length consistency
-        lines = text.split('\n')
-        avg_line_length = sum(len(line) for line in lines) / max(len(lines), 1)
+        # Check line length consistency; total line length is the text
+        # length minus the newlines, so no per-line pass is needed
+        newline_count = text.count('\n')
+        avg_line_length = (len(text) - newline_count) / (newline_count + 1)
         if avg_line_length < 20:
             score -= 10
             issues.append("Inconsistent line formatting")
@@ -120,23 +159,18 @@ class ATSScorer:
             'issues': issues
         }
     
-    def _calculate_section_score(self, text: str) -> Dict:
+    def _calculate_section_score(self, views: Dict) -> Dict:
         """Calculate section completeness score."""
         found_sections = []
         missing_sections = []
         
-        text_lower = text.lower()
+        text_lower = views['lower']
         
         for section in self.ESSENTIAL_SECTIONS:
-            # Look for section headers
-            patterns = [
-                f'\n{section}',
-                f'\n{section.upper()}',
-                f'{section}:',
-                f'{section.upper()}:'
-            ]
-            
-            found = any(pattern in text_lower for pattern in patterns)
+            # Look for section headers; the text is lowercased, so only the
+            # lowercase header forms can match
+            line_start, with_colon = self._SECTION_HEADERS[section]
+            found = line_start in text_lower or with_colon in text_lower
             
             if found:
                 found_sections.append(section)
@@ -158,15 +192,12 @@ class ATSScorer:
             'issues': issues
         }
     
-    def _calculate_keyword_score(self, text: str, job_description: str = None) -> Dict:
+    def _calculate_keyword_score(self, views: Dict, job_description: str = None) -> Dict:
         """Calculate keyword relevance score."""
-        text_lower = text.lower()
-        found_keywords = []
-        
-        # Check for common ATS keywords
-        for keyword in self.COMMON_ATS_KEYWORDS:
-            if keyword in text_lower:
-                found_keywords.append(keyword)
+        # Check for common ATS keywords (all single words) by whole-word
+        # lookup in the resume's token set
+        word_set = views['word_set']
+        found_keywords = [k for k in self.COMMON_ATS_KEYWORDS if k in word_set]
         
         base_score = (len(found_keywords) / len(self.COMMON_ATS_KEYWORDS)) * 100
         
@@ -174,10 +205,10 @@ class ATSScorer:
         
         # If job description provided, check for matching keywords
         if job_description:
-            jd_words = set(re.findall(r'\b\w+\b', job_description.lower()))
+            jd_words = set(self._WORD_RE.findall(job_description.lower()))
             jd_words = {w for w in jd_words if len(w) > 4}  # Filter short words
             
-            resume_words = set(re.findall(r'\b\w+\b', text_lower))
+            resume_words = views['word_set']
             
             matching_keywords = jd_words & resume_words
             match_ratio = len(matching_keywords) / max(len(jd_words), 1)
@@ -198,12 +229,13 @@ class ATSScorer:
             'issues': issues
         }
     
-    def _calculate_content_score(self, text: str) -> Dict:
+    def _calculate_content_score(self, views: Dict) -> Dict:
         """Calculate content quality score."""
+        text = views['text']
         score = 100
         issues = []
         
-        word_count = len(text.split())
+        word_count = views['word_count']
         
         # Check word count
         if word_count < 200:
@@ -216,19 +248,15 @@ class ATSScorer:
             issues.append("Appropriate length")
         
         # Check for numbers (quantifiable achievements)
-        numbers = re.findall(r'\d+', text)
+        numbers = self._NUMBER_RE.findall(text)
         if len(numbers) < 5:
             score -= 20
             issues.append("Add more quantifiable achievements")
         else:
             issues.append("Good use of metrics")
         
-        # Check for action verbs
-        action_verbs = [
-            'led', 'managed', 'developed', 'created', 'implemented',
-            'designed', 'achieved', 'improved', 'increased', 'built'
-        ]
-        verb_count = sum(1 for verb in action_verbs if verb in text.lower())
+        # Check for action verbs (distinct verbs used)
+        verb_count = len({verb.lower() for verb in ACTION_VERBS_RE.findall(text)})
         
         if verb_count < 3:
             score -= 15
@@ -242,33 +270,34 @@ class ATSScorer:
             'issues': issues
         }
     
-    def _calculate_contact_score(self, text: str) -> Dict:
+    def _calculate_contact_score(self, views: Dict) -> Dict:
         """Calculate contact information completeness."""
+        text = views['text']
         score = 0
         found_contact = []
         missing_contact = []
         
         # Email
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
+        if self._EMAIL_RE.search(text):
             score += 40
             found_contact.append('email')
         else:
             missing_contact.append('email')
         
         # Phone
-        if re.search(r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text):
+        if self._PHONE_RE.search(text):
             score += 30
             found_contact.append('phone')
         else:
             missing_contact.append('phone')
         
         # LinkedIn
-        if re.search(r'linkedin\.com/in/', text.lower()):
+        if self._LINKEDIN_RE.search(views['lower']):
             score += 20
             found_contact.append('linkedin')
         
         # Location (City, State)
-        if re.search(r',\s*[A-Z]{2}\b', text):
+        if self._LOCATION_RE.search(text):
             score += 10
             found_contact.append('location')
         
@@ -3,11 +3,16 @@ Job Matcher Module
 Uses sentence embeddings to match resumes with job descriptions.
 """
 
+import os
 import numpy as np
-from sentence_transformers import SentenceTransformer, util
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import logging
 
+from src._patterns import ACTION_VERBS_RE
+from src.utils import text_hash, LRUCache, Lazy, ensure_dir
+from models.model_loader import ModelLoader
+from models.onnx_encoder import OnnxEncoder, QUANTIZED_MODEL_FILE
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,44 +28,162 @@ class JobMatcher:
         Args:
             model_name: HuggingFace model name for embeddings
         """
+        self.backend = "torch"
+        
+        # Prefer the int8 ONNX export when one has been built
+        # (python -m models.onnx_encoder)
+        onnx_dir = os.getenv('ONNX_MODEL_DIR')
+        if onnx_dir and os.path.exists(os.path.join(onnx_dir, QUANTIZED_MODEL_FILE)):
+            self.backend = "onnx-int8"
+        elif os.getenv('RA_INT8') == '1':
+            # Quantize the PyTorch model's Linear layers to int8 instead
+            self.backend = "torch-int8"
+        
+        # The model is loaded on first use, so code paths that never embed
+        # (e.g. ATS scoring only) do not pay for it
+        self.model = Lazy(lambda: self._load_model(model_name, onnx_dir))
+        
+        self.model_name = model_name
+        
+        # Embeddings keyed by content hash, so a resume or skill encoded by
+        # one method is reused by the others
+        self._embedding_cache = LRUCache(maxsize=512)
+        
+        # Precomputed embeddings for a fixed job collection (see build_job_index)
+        self.job_index: Optional[np.ndarray] = None
+        self.indexed_jobs: List[Dict[str, str]] = []
+        # Backend the job index was encoded with, and where it is cached
+        self._job_index_backend: Optional[str] = None
+        self._job_index_cache_dir: Optional[str] = None
+    
+    def _load_model(self, model_name: str, onnx_dir: Optional[str]):
+        """Load the embedding model for the configured backend."""
+        if self.backend == "onnx-int8":
+            try:
+                model = OnnxEncoder(onnx_dir)
+                logger.info(f"Loaded int8 ONNX embedding model from {onnx_dir}")
+                return model
+            except Exception as e:
+                logger.warning(f"ONNX model unavailable, falling back to PyTorch: {e}")
+                self.backend = "torch"
+        
         try:
-            self.model = SentenceTransformer(model_name)
+            model = ModelLoader().load_sentence_transformer(
+                model_name, quantize=self.backend == "torch-int8"
+            )
             logger.info(f"Loaded embedding model: {model_name}")
+            return model
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
-        
-        self.model_name = model_name
     
     def encode_text(self, text: str) -> np.ndarray:
         """
         Generate embedding for text.
         
+        Embeddings are L2-normalized, so cosine similarity between two of
+        them is a plain dot product.
+        
         Args:
             text: Input text
             
         Returns:
-            Embedding vector
+            Unit-length embedding vector
         """
-        return self.model.encode(text, convert_to_tensor=False)
+        return self._embedding_cache.get_or_set(
+            text_hash(text),
+            lambda: self.model.encode(
+                text, convert_to_numpy=True, normalize_embeddings=True
+            ).astype(np.float32)
+        )
     
-    def calculate_similarity(self, resume_text: str, job_description: str) -> float:
+    def encode_texts(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Generate embeddings for several texts, encoding cache misses in one batch.
+        
+        Args:
+            texts: Input texts
+            batch_size: Encoding batch size
+            
+        Returns:
+            Unit-length embedding matrix of shape (len(texts), embedding_dim)
+        """
+        keys = [text_hash(text) for text in texts]
+        embeddings = [self._embedding_cache.get(key) for key in keys]
+        
+        missing = {}
+        for idx, embedding in enumerate(embeddings):
+            if embedding is None:
+                missing.setdefault(keys[idx], []).append(idx)
+        
+        if missing:
+            miss_texts = [texts[indices[0]] for indices in missing.values()]
+            encoded = self.model.encode(
+                miss_texts,
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            ).astype(np.float32)
+            for (key, indices), embedding in zip(missing.items(), encoded):
+                self._embedding_cache.set(key, embedding)
+                for idx in indices:
+                    embeddings[idx] = embedding
+        
+        return np.stack(embeddings)
+    
+    def calculate_similarity(
+        self,
+        resume_text: str,
+        job_description: str,
+        job_embedding: Optional[np.ndarray] = None
+    ) -> float:
         """
         Calculate semantic similarity between resume and job description.
         
         Args:
             resume_text: Resume content
             job_description: Job description content
+            job_embedding: Optional embedding of job_description from encode_text
             
         Returns:
             Similarity score (0-1)
         """
         resume_embedding = self.encode_text(resume_text)
-        job_embedding = self.encode_text(job_description)
+        if job_embedding is None:
+            job_embedding = self.encode_text(job_description)
         
-        similarity = util.cos_sim(resume_embedding, job_embedding)
-        return float(similarity[0][0])
-    
+        return float(resume_embedding @ job_embedding)
+
+    def calculate_similarities(
+        self,
+        resume_texts: List[str],
+        job_description: str,
+        batch_size: int = 16
+    ) -> List[float]:
+        """
+        Calculate similarity of several resumes against one job description.
+
+        Resumes are encoded in batches, which is considerably faster than
+        calling calculate_similarity once per resume.
+
+        Args:
+            resume_texts: List of resume contents
+            job_description: Job description content
+            batch_size: Encoding batch size
+
+        Returns:
+            Similarity scores (0-1), in the same order as resume_texts
+        """
+        if not resume_texts:
+            return []
+
+        resume_embeddings = self.encode_texts(resume_texts, batch_size=batch_size)
+        job_embedding = self.encode_text(job_description)
+
+        similarities = resume_embeddings @ job_embedding
+        return [float(s) for s in similarities]
+
     def match_jobs(
         self, 
         resume_text: str, 
@@ -85,17 +208,128 @@ class JobMatcher:
         resume_embedding = self.encode_text(resume_text)
         
         # Generate job embeddings
-        job_texts = [
-            f"{job.get('title', '')} {job.get('description', '')}" 
-            for job in job_descriptions
-        ]
-        job_embeddings = self.model.encode(job_texts, convert_to_tensor=False)
+        job_texts = [self._job_text(job) for job in job_descriptions]
+        job_embeddings = self.encode_texts(job_texts, batch_size=64)
         
         # Calculate similarities
-        similarities = util.cos_sim(resume_embedding, job_embeddings)[0]
+        similarities = job_embeddings @ resume_embedding
+        
+        return self._rank_jobs(job_descriptions, similarities, top_k)
+    
+    def build_job_index(
+        self,
+        job_descriptions: List[Dict[str, str]],
+        cache_dir: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Precompute embeddings for a fixed job collection.
+        
+        The embeddings are normalized so that match_indexed_jobs can score
+        a resume against every job with a single matrix-vector product.
+        When cache_dir is given, the matrix is saved there and memory-mapped
+        on later runs with the same model and jobs.
+        
+        Args:
+            job_descriptions: List of job dicts with 'title' and 'description'
+            cache_dir: Optional directory for the on-disk embedding cache
+            
+        Returns:
+            Embedding matrix of shape (num_jobs, embedding_dim)
+        """
+        job_texts = [self._job_text(job) for job in job_descriptions]
+        
+        cache_path = self._job_index_path(cache_dir, job_texts) if cache_dir else None
+        
+        # The backend is only known for sure once the model has loaded (the
+        # ONNX export may fail and fall back to PyTorch); a cache hit keyed
+        # on the configured backend is re-checked in match_indexed_jobs
+        backend = self.backend
+        if cache_path and os.path.exists(cache_path):
+            embeddings = np.load(cache_path, mmap_mode='r')
+            logger.info(f"Loaded job index from {cache_path}")
+        else:
+            embeddings = self._encode_job_index(job_texts, cache_dir)
+            backend = self.backend
+        
+        self.job_index = embeddings
+        self.indexed_jobs = list(job_descriptions)
+        self._job_index_backend = backend
+        self._job_index_cache_dir = cache_dir
+        logger.info(f"Indexed {len(self.indexed_jobs)} jobs")
+        return embeddings
+    
+    def _encode_job_index(self, job_texts: List[str], cache_dir: Optional[str]) -> np.ndarray:
+        """Encode job texts with the loaded model, saving them under cache_dir."""
+        if not job_texts:
+            return np.empty((0, 0), dtype=np.float32)
+        
+        embeddings = self.model.encode(
+            job_texts,
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        ).astype(np.float32)
+        if cache_dir:
+            # Keyed after encoding, so the key names the backend actually used
+            ensure_dir(cache_dir)
+            np.save(self._job_index_path(cache_dir, job_texts), embeddings)
+        return embeddings
+    
+    def match_indexed_jobs(self, resume_text: str, top_k: int = 5) -> List[Dict]:
+        """
+        Find top matching jobs from the collection given to build_job_index.
+        
+        Args:
+            resume_text: Resume content
+            top_k: Number of top matches to return
+            
+        Returns:
+            List of top matching jobs with similarity scores
+        """
+        if self.job_index is None or not self.indexed_jobs:
+            return []
+        
+        resume_embedding = self.encode_text(resume_text)
         
-        # Get top k matches
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # A cached index keyed on the configured backend is stale if the
+        # model fell back to another backend while loading
+        if self._job_index_backend != self.backend:
+            logger.warning(
+                f"Job index was encoded with {self._job_index_backend}, model loaded "
+                f"as {self.backend}; re-encoding jobs"
+            )
+            job_texts = [self._job_text(job) for job in self.indexed_jobs]
+            self.job_index = self._encode_job_index(job_texts, self._job_index_cache_dir)
+            self._job_index_backend = self.backend
+        
+        similarities = self.job_index @ resume_embedding
+        
+        return self._rank_jobs(self.indexed_jobs, similarities, top_k)
+    
+    def _job_index_path(self, cache_dir: str, job_texts: List[str]) -> str:
+        """On-disk location of the job index for this model, backend and jobs."""
+        key = text_hash(
+            f"{self.model_name}:{self.backend}\n" + "\n".join(job_texts)
+        ).hex()
+        return os.path.join(cache_dir, f"job_index_{key}.npy")
+    
+    @staticmethod
+    def _job_text(job: Dict[str, str]) -> str:
+        """Text used to embed a job posting."""
+        return f"{job.get('title', '')} {job.get('description', '')}"
+    
+    @staticmethod
+    def _rank_jobs(job_descriptions: List[Dict[str, str]], similarities, top_k: int) -> List[Dict]:
+        """Build ranked match results from per-job similarity scores."""
+        similarities = np.asarray(similarities)
+        k = min(top_k, len(similarities))
+        if k <= 0:
+            return []
+        
+        # Partial selection of the k best, then sort only those
+        top_indices = np.argpartition(-similarities, k - 1)[:k]
+        top_indices = top_indices[np.argsort(-similarities[top_indices], kind='stable')]
         
         results = []
         for idx in top_indices:
@@ -141,19 +375,21 @@ class JobMatcher:
         
         # Semantic similarity for non-exact matches
         similar_skills = []
-        if missing_skills and resume_skills:
-            for req_skill in missing_skills:
-                req_embedding = self.encode_text(req_skill)
-                for resume_skill in resume_skills_lower:
-                    if resume_skill not in matching_skills:
-                        skill_embedding = self.encode_text(resume_skill)
-                        similarity = util.cos_sim(req_embedding, skill_embedding)[0][0]
-                        if similarity > 0.7:  # Threshold for similar skills
-                            similar_skills.append({
-                                'required': req_skill,
-                                'resume_has': resume_skill,
-                                'similarity': float(similarity)
-                            })
+        candidate_skills = [s for s in resume_skills_lower if s not in matching_skills]
+        if missing_skills and candidate_skills:
+            # Two batched encodes and one similarity matrix instead of a
+            # forward pass per (required, resume) pair
+            req_embeddings = self.encode_texts(missing_skills, batch_size=64)
+            candidate_embeddings = self.encode_texts(candidate_skills, batch_size=64)
+            similarities = req_embeddings @ candidate_embeddings.T
+            
+            # Threshold for similar skills
+            for i, j in np.argwhere(similarities > 0.7):
+                similar_skills.append({
+                    'required': missing_skills[i],
+                    'resume_has': candidate_skills[j],
+                    'similarity': float(similarities[i, j])
+                })
         
         return {
             'matching_skills': matching_skills,
@@ -210,11 +446,7 @@ class JobMatcher:
             )
         
         # Check for action verbs
-        action_verbs = [
-            'led', 'managed', 'developed', 'created', 'implemented', 
-            'designed', 'achieved', 'improved', 'increased', 'decreased'
-        ]
-        has_action_verbs = any(verb in resume_text.lower() for verb in action_verbs)
+        has_action_verbs = ACTION_VERBS_RE.search(resume_text) is not None
         if not has_action_verbs:
             recommendations.append(
                 "Use strong action verbs to describe your accomplishments (e.g., 'Led', 'Developed', 'Achieved')"
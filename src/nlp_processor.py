@@ -5,14 +5,77 @@ entity recognition, and text analysis.
 """
 
 import re
-import spacy
-from typing import List, Dict, Set, Optional
+from dataclasses import dataclass, field
+from typing import Iterator, List, Dict, Set, Optional, Union
 from collections import Counter
 import logging
 
+try:
+    import ahocorasick
+except ImportError:  # optional, falls back to per-skill regex search
+    ahocorasick = None
+
+from models.model_loader import ModelLoader
+
 logger = logging.getLogger(__name__)
 
 
+def _is_word_char(char: str) -> bool:
+    """Return True if char would match the regex class \\w."""
+    return char.isalnum() or char == '_'
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Return True if the regex anchor \\b would match at text[index]."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+@dataclass
+class ExperienceTable:
+    """
+    Experience entries stored column-wise: entry i is
+    (raw_text[i], dates[i], descriptions[i]).
+    
+    Indexing, slicing and iteration yield the per-entry dicts
+    ({'raw_text', 'dates', 'description'}) for existing callers.
+    """
+    raw_text: List[str] = field(default_factory=list)
+    dates: List[List[str]] = field(default_factory=list)
+    descriptions: List[List[str]] = field(default_factory=list)
+    
+    def append(self, raw_text: str, dates: List[str]):
+        """Start a new entry with an empty description."""
+        self.raw_text.append(raw_text)
+        self.dates.append(dates)
+        self.descriptions.append([])
+    
+    def row(self, index: int) -> Dict:
+        """Return entry index as a dict."""
+        return {
+            'raw_text': self.raw_text[index],
+            'dates': self.dates[index],
+            'description': self.descriptions[index]
+        }
+    
+    def rows(self) -> Iterator[Dict]:
+        """Yield every entry as a dict."""
+        for index in range(len(self.raw_text)):
+            yield self.row(index)
+    
+    def __len__(self) -> int:
+        return len(self.raw_text)
+    
+    def __iter__(self) -> Iterator[Dict]:
+        return self.rows()
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        return self.row(range(len(self))[index])
+
+
 class NLPProcessor:
     """
     Advanced NLP processor for resume analysis using spaCy and transformers.
@@ -53,46 +116,179 @@ class NLPProcessor:
         ]
     }
     
+    # Section headers used to locate experience and education blocks
+    EXPERIENCE_KEYWORDS = ['experience', 'employment', 'work history']
+    EDUCATION_KEYWORDS = ['education', 'academic']
+    
+    # Words that mark a short line as a section header
+    SECTION_KEYWORDS = EXPERIENCE_KEYWORDS + EDUCATION_KEYWORDS + [
+        'skills', 'summary', 'profile', 'objective', 'projects', 'certifications'
+    ]
+    _SECTION_KEYWORD_RE = re.compile(
+        r'\b(?:' + '|'.join(SECTION_KEYWORDS) + r')\b', re.IGNORECASE
+    )
+    
+    # Four-digit years from 1900 to 2099
+    _YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+    
     def __init__(self, use_gpu: bool = False):
         """Initialize NLP processor with models."""
-        self.nlp = None
-        try:
-            import spacy
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.info("Loaded spaCy model: en_core_web_sm")
-        except Exception as e:
-            logger.warning(f"spaCy model not available: {e}. Using fallback methods.")
-            self.nlp = None
+        # Skills, experience and education are extracted with patterns;
+        # only NER (extract_entities) and tagger/lemmatizer
+        # (extract_keywords) run through spaCy, so the parser is skipped.
+        # The shared ModelLoader keeps one copy across instances.
+        self.nlp = ModelLoader().load_spacy_model("en_core_web_sm", exclude=["parser"])
+        if self.nlp is None:
+            logger.warning("spaCy model not available. Using fallback methods.")
         
         self.all_skills = []
         for category, skills in self.TECH_SKILLS.items():
             self.all_skills.extend(skills)
         
+        # Skills are matched on the raw characters rather than spaCy tokens,
+        # so punctuated forms ("react.js", "r.", "github.com/...") are found
+        # exactly as the r'\b...\b' search finds them
+        self._skill_automaton = self._get_skill_automaton()
+        self._skill_patterns = self._build_skill_patterns()
+        
         logger.info("NLPProcessor initialized")
     
+    def extract_all(self, text: str) -> Dict:
+        """
+        Extract skills, experience and education in one call.
+        
+        Equivalent to calling extract_skills, calculate_experience_years,
+        extract_experience and extract_education in turn.
+        
+        Args:
+            text: Resume text
+            
+        Returns:
+            Dictionary with 'skills', 'experience_years', 'experiences'
+            and 'education'
+        """
+        sections = self._split_sections(text)
+        exp_section = self._find_section(text, self.EXPERIENCE_KEYWORDS, sections)
+        edu_section = self._find_section(text, self.EDUCATION_KEYWORDS, sections)
+        
+        return {
+            'skills': self._skills_from_lower(text.lower()),
+            'experience_years': self.calculate_experience_years(text),
+            'experiences': self._experience_from_section(exp_section),
+            'education': self._education_from_section(edu_section)
+        }
+    
     def extract_skills(self, text: str) -> Dict[str, List[str]]:
         """Extract technical and soft skills from text."""
-        text_lower = text.lower()
+        return self._skills_from_lower(text.lower())
+    
+    @classmethod
+    def _get_skill_automaton(cls):
+        """
+        Return an Aho-Corasick automaton over all skills so they can be
+        found in a single pass over the text.
+        
+        The automaton depends only on TECH_SKILLS, so it is built once per
+        class and shared by all instances.
+        
+        Returns:
+            Automaton mapping each skill to its (category, skill) pair,
+            or None if pyahocorasick is not installed
+        """
+        if ahocorasick is None:
+            logger.info("pyahocorasick not installed, using regex skill matching")
+            return None
+        
+        if '_shared_automaton' not in cls.__dict__:
+            automaton = ahocorasick.Automaton()
+            for category, skills in cls.TECH_SKILLS.items():
+                for skill in skills:
+                    automaton.add_word(skill, (category, skill))
+            automaton.make_automaton()
+            cls._shared_automaton = automaton
+        return cls._shared_automaton
+    
+    def _build_skill_patterns(self) -> Dict[str, "re.Pattern"]:
+        """
+        Compile one whole-word alternation per skill category.
+        
+        The alternation sits in a lookahead so matches may overlap, and
+        longer skills are tried first, so every skill that the per-skill
+        r'\b...\b' search would find is still reported.
+        
+        Returns:
+            Mapping of category to compiled pattern
+        """
+        patterns = {}
+        for category, skills in self.TECH_SKILLS.items():
+            alternation = '|'.join(
+                re.escape(skill) for skill in sorted(skills, key=len, reverse=True)
+            )
+            patterns[category] = re.compile(r'(?=\b(' + alternation + r')\b)')
+        return patterns
+    
+    def _skills_from_lower(self, text_lower: str) -> Dict[str, List[str]]:
+        """Match the skill database against already-lowercased text."""
+        if self._skill_automaton is not None:
+            return self._skills_from_automaton(text_lower)
+        
         found_skills = {}
         
         for category, skills in self.TECH_SKILLS.items():
-            found = []
-            for skill in skills:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found.append(skill)
-            
+            found = set(self._skill_patterns[category].findall(text_lower))
             if found:
-                found_skills[category] = found
+                found_skills[category] = [skill for skill in skills if skill in found]
+        
+        return found_skills
+    
+    def _skills_from_automaton(self, text_lower: str) -> Dict[str, List[str]]:
+        """Find skills with the Aho-Corasick automaton in one pass."""
+        found = set()
+        for end, (category, skill) in self._skill_automaton.iter(text_lower):
+            start = end - len(skill) + 1
+            # Keep the same whole-word semantics as the r'\b...\b' regex
+            if _is_word_boundary(text_lower, start) and _is_word_boundary(text_lower, end + 1):
+                found.add((category, skill))
+        
+        return self._group_skills(found)
+    
+    def _group_skills(self, found: Set[tuple]) -> Dict[str, List[str]]:
+        """Arrange found (category, skill) pairs in skill database order."""
+        found_skills = {}
+        for category, skills in self.TECH_SKILLS.items():
+            matched = [skill for skill in skills if (category, skill) in found]
+            if matched:
+                found_skills[category] = matched
         
         return found_skills
     
-    def extract_entities(self, text: str) -> Dict[str, List[str]]:
-        """Extract named entities using spaCy."""
+    def analyze(self, text: str, top_n: int = 20) -> Dict:
+        """
+        Run the spaCy pipeline once and derive entities and keywords from it.
+        
+        Equivalent to calling extract_entities and extract_keywords, which
+        would each run the full pipeline over the text.
+        
+        Args:
+            text: Input text
+            top_n: Number of keywords to return
+            
+        Returns:
+            Dictionary with 'entities' and 'keywords'
+        """
+        doc = self.nlp(text) if self.nlp else None
+        return {
+            'entities': self.extract_entities(text, doc=doc),
+            'keywords': self.extract_keywords(text, top_n, doc=doc)
+        }
+    
+    def extract_entities(self, text: str, doc=None) -> Dict[str, List[str]]:
+        """Extract named entities using spaCy, reusing doc if already parsed."""
         if not self.nlp:
             return {}
         
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         entities = {}
         
         for ent in doc.ents:
@@ -103,45 +299,45 @@ class NLPProcessor:
         
         return {k: list(set(v)) for k, v in entities.items()}
     
-    def extract_experience(self, text: str) -> List[Dict[str, str]]:
+    def extract_experience(self, text: str) -> ExperienceTable:
         """Extract work experience entries from text."""
-        experiences = []
+        exp_section = self._find_section(text, self.EXPERIENCE_KEYWORDS)
+        return self._experience_from_section(exp_section)
+    
+    def _experience_from_section(self, exp_section: Optional[str]) -> ExperienceTable:
+        """Split an experience section into dated entries."""
+        experiences = ExperienceTable()
         date_pattern = r'(\d{4}|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{4})'
         
-        exp_section = self._find_section(text, ['experience', 'employment', 'work history'])
         if not exp_section:
             return experiences
         
         lines = exp_section.split('\n')
-        current_entry = {}
+        in_entry = False
         
         for line in lines:
             line = line.strip()
             if not line:
-                if current_entry:
-                    experiences.append(current_entry)
-                    current_entry = {}
+                # A blank line closes the current entry
+                in_entry = False
                 continue
             
             dates = re.findall(date_pattern, line, re.IGNORECASE)
-            if dates and len(dates) >= 1:
-                if current_entry:
-                    experiences.append(current_entry)
-                current_entry = {
-                    'raw_text': line,
-                    'dates': dates,
-                    'description': []
-                }
-            elif current_entry:
-                current_entry['description'].append(line)
-        
-        if current_entry:
-            experiences.append(current_entry)
+            if dates:
+                experiences.append(line, dates)
+                in_entry = True
+            elif in_entry:
+                experiences.descriptions[-1].append(line)
         
         return experiences
     
     def extract_education(self, text: str) -> List[Dict[str, str]]:
         """Extract education information."""
+        edu_section = self._find_section(text, self.EDUCATION_KEYWORDS)
+        return self._education_from_section(edu_section)
+    
+    def _education_from_section(self, edu_section: Optional[str]) -> List[Dict[str, str]]:
+        """Collect lines of an education section that mention a degree."""
         education = []
         degree_patterns = [
             r'\b(bachelor|b\.s\.|b\.a\.|bs|ba|undergraduate)\b',
@@ -150,7 +346,6 @@ class NLPProcessor:
             r'\b(associate|a\.s\.|a\.a\.)\b'
         ]
         
-        edu_section = self._find_section(text, ['education', 'academic'])
         if not edu_section:
             return education
         
@@ -164,13 +359,76 @@ class NLPProcessor:
         
         return education
     
-    def _find_section(self, text: str, keywords: List[str]) -> Optional[str]:
-        """Find a section in text based on keywords."""
-        text_lower = text.lower()
+    def _is_header(self, line: str) -> bool:
+        """
+        Return True if line looks like a section header: at most four
+        words, no digits, and either containing a section keyword or
+        ending with a colon (e.g. "EXPERIENCE", "Work History:").
+        
+        Capitalization alone does not count, so a company name such as
+        "GOOGLE" on its own line stays inside its section.
+        """
+        stripped = line.strip()
+        title = stripped.rstrip(':').strip()
+        if not title or len(title.split()) > 4 or any(char.isdigit() for char in title):
+            return False
+        return stripped.endswith(':') or self._SECTION_KEYWORD_RE.search(title) is not None
+    
+    def _split_sections(self, text: str) -> List[tuple]:
+        """
+        Split text into sections at header lines in a single pass.
+        
+        Args:
+            text: Resume text
+            
+        Returns:
+            List of (lowercased header, section text) pairs in document
+            order; each section runs from its header line up to the next
+            header
+        """
+        lines = text.split('\n')
+        header_idxs = [idx for idx, line in enumerate(lines) if self._is_header(line)]
+        
+        return [
+            (lines[start].strip().lower(), '\n'.join(lines[start:end]))
+            for start, end in zip(header_idxs, header_idxs[1:] + [len(lines)])
+        ]
+    
+    def _find_section(
+        self,
+        text: str,
+        keywords: List[str],
+        sections: Optional[List[tuple]] = None
+    ) -> Optional[str]:
+        """
+        Find a section in text based on keywords.
+        
+        Keywords are tried in priority order; for each, the first header
+        line mentioning it wins. Text without
+        recognisable headers, such as cleaned single-line text, falls
+        back to slicing from the first keyword occurrence.
+        
+        Args:
+            text: Text to search
+            keywords: Keywords naming the section, in priority order
+            sections: Optional precomputed result of _split_sections(text)
+            
+        Returns:
+            Section text, or None if no keyword occurs
+        """
+        if sections is None:
+            sections = self._split_sections(text)
+        
+        for keyword in keywords:
+            pattern = re.compile(r'\b' + keyword + r'\b')
+            for header, section in sections:
+                if pattern.search(header):
+                    return section
         
         for keyword in keywords:
-            pattern = r'\b' + keyword + r'\b.*?(?=\n[A-Z]{2,}|\Z)'
-            match = re.search(pattern, text_lower, re.DOTALL)
+            # Case-insensitive search on the original text, so match offsets
+            # index text directly and no lowercased copy is needed
+            match = re.search(r'\b' + keyword + r'\b', text, re.IGNORECASE)
             if match:
                 start = match.start()
                 next_section = re.search(r'\n[A-Z\s]{10,}\n', text[start + 50:])
@@ -181,27 +439,37 @@ class NLPProcessor:
     
     def calculate_experience_years(self, text: str) -> float:
         """Estimate total years of experience from text."""
-        years = re.findall(r'\b(19|20)\d{2}\b', text)
-        years = [int(y) for y in years]
+        # Track the earliest and latest year in one pass over the matches
+        # (non-capturing century group, so each match is a whole year)
+        count = 0
+        earliest = latest = 0
+        for match in self._YEAR_RE.finditer(text):
+            year = int(match.group())
+            if count == 0:
+                earliest = latest = year
+            elif year < earliest:
+                earliest = year
+            elif year > latest:
+                latest = year
+            count += 1
         
-        if len(years) < 2:
+        if count < 2:
             return 0.0
         
-        min_year = min(years)
-        max_year = max(years)
-        experience_years = max_year - min_year
+        experience_years = latest - earliest
         
-        return min(experience_years, 50)
+        return float(min(experience_years, 50))
     
-    def extract_keywords(self, text: str, top_n: int = 20) -> List[tuple]:
-        """Extract top keywords from text."""
+    def extract_keywords(self, text: str, top_n: int = 20, doc=None) -> List[tuple]:
+        """Extract top keywords from text, reusing doc if already parsed."""
         if not self.nlp:
             words = re.findall(r'\b\w+\b', text.lower())
             common_words = set(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'])
             words = [w for w in words if w not in common_words and len(w) > 3]
             return Counter(words).most_common(top_n)
         
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         important_tokens = [
             token.lemma_.lower() 
             for token in doc 
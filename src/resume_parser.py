@@ -3,40 +3,244 @@ Resume Parser Module
 Handles PDF/DOCX parsing and text extraction from resumes.
 """
 
+import os
 import re
-import PyPDF2
-import pdfplumber
-from typing import Dict, Optional, List
+import hashlib
+import zipfile
+import importlib
+from bisect import bisect_left
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain, islice
+from typing import Dict, Optional, List, Tuple, Union
 from pathlib import Path
 import logging
-from docx import Document
+
+from src.utils import generate_file_hash, load_json, map_file, save_json
+
+# PDF/DOCX libraries are imported on first use: together they add
+# hundreds of milliseconds to importing this module, which plain-text
+# callers never need
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the parse result or text cleaning changes, so stale
+# parse-cache entries are no longer served
+PARSE_CACHE_VERSION = 2
+
+# Patterns used on every parsed resume, compiled once at import
+_WS_RE = re.compile(r'\s+')
+_NONSPACE_RE = re.compile(r'\S')
+_SPECIAL_RE = re.compile(r'[^\w\s\.,;:\-\(\)@/]')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'github\.com/[\w-]+', re.IGNORECASE)
+
+# str.translate table deleting the ASCII characters _SPECIAL_RE removes,
+# derived from the pattern so the two cannot drift apart
+_ASCII_SPECIAL_DELETE = {
+    code: None for code in range(128) if _SPECIAL_RE.match(chr(code))
+}
+
+# Common section headers
+_SECTION_PATTERNS = {
+    'summary': r'(professional summary|summary|profile|objective)',
+    'experience': r'(work experience|experience|employment history|professional experience)',
+    'education': r'(education|academic background|qualifications)',
+    'skills': r'(skills|technical skills|core competencies|expertise)',
+    'projects': r'(projects|portfolio)',
+    'certifications': r'(certifications|certificates|licenses)'
+}
+
+# All headers as one named-group alternation
+_SECTION_ALTERNATION = '|'.join(
+    f'(?P<{name}>{pattern})' for name, pattern in _SECTION_PATTERNS.items()
+)
+
+# Zero-width form, so a single finditer reports every position where any
+# header starts (overlaps included) and which section it belongs to.
+# Case-insensitive, so the resume never needs a lowercased copy.
+_SECTION_SCAN_RE = re.compile(f'(?={_SECTION_ALTERNATION})', re.IGNORECASE)
+
+
+# WordprocessingML namespace, in lxml's Clark notation
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Run children that python-docx renders as characters
+_DOCX_RUN_CHARS = {
+    f'{_W}tab': '\t', f'{_W}ptab': '\t', f'{_W}cr': '\n', f'{_W}noBreakHyphen': '-'
+}
+
+
+def _docx_paragraph_text(paragraph) -> str:
+    """Return a w:p element's text the way python-docx's Paragraph.text does."""
+    parts = []
+    for child in paragraph:
+        if child.tag == f'{_W}r':
+            runs = (child,)
+        elif child.tag == f'{_W}hyperlink':
+            runs = child.iterfind(f'{_W}r')
+        else:
+            continue
+        for run in runs:
+            for item in run:
+                if item.tag == f'{_W}t':
+                    parts.append(item.text or '')
+                elif item.tag == f'{_W}br':
+                    # Only line breaks are text; page and column breaks are ''
+                    if item.get(f'{_W}type', 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+                elif item.tag in _DOCX_RUN_CHARS:
+                    parts.append(_DOCX_RUN_CHARS[item.tag])
+    return ''.join(parts)
+
+
+
+def _docx_table_cells(table) -> List[str]:
+    """
+    Return a w:tbl element's cell texts the way python-docx's row.cells
+    yields them: one entry per layout-grid column, so a horizontally
+    merged cell repeats across its span and a vertically merged
+    continuation cell repeats the text of the cell it continues.
+    """
+    texts = []
+    # Grid column -> (text, span) of the cell occupying it in the row above
+    above: Dict[int, Tuple[str, int]] = {}
+    for row in table.iterfind(f'{_W}tr'):
+        grid_before = row.find(f'{_W}trPr/{_W}gridBefore')
+        col = int(grid_before.get(f'{_W}val')) if grid_before is not None else 0
+        current: Dict[int, Tuple[str, int]] = {}
+        for cell in row.iterfind(f'{_W}tc'):
+            span = cell.find(f'{_W}tcPr/{_W}gridSpan')
+            span = int(span.get(f'{_W}val')) if span is not None else 1
+            v_merge = cell.find(f'{_W}tcPr/{_W}vMerge')
+            if v_merge is not None and v_merge.get(f'{_W}val', 'continue') == 'continue':
+                # python-docx yields the root cell of the vertical span
+                entry = above.get(col, ('', span))
+            else:
+                entry = ("\n".join(_docx_paragraph_text(p) for p in cell.iterfind(f'{_W}p')), span)
+            texts.extend([entry[0]] * entry[1])
+            for offset in range(span):
+                current[col + offset] = entry
+            col += span
+        above = current
+    return texts
+
+
+@lru_cache(maxsize=None)
+def _optional_import(name: str):
+    """Import an optional backend once, returning None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _section_re2():
+    """Compile the header alternation with google-re2 if it is installed."""
+    re2 = _optional_import('re2')
+    return re2.compile(f'(?i){_SECTION_ALTERNATION}') if re2 is not None else None
+
+
+def _section_hits(text: str) -> List[Tuple[int, str]]:
+    """
+    Return (position, section name) for every header occurrence.
+    
+    With google-re2 installed, ASCII text is scanned by its linear-time
+    DFA. re2 has no lookahead, so each search resumes one character past
+    the previous hit to still report overlapping headers; the text is
+    encoded once up front because re2 would re-encode a str on every
+    search (byte and character offsets coincide for ASCII).
+    """
+    scanner = _section_re2()
+    if scanner is None or not text.isascii():
+        return [(m.start(), m.lastgroup) for m in _SECTION_SCAN_RE.finditer(text)]
+    
+    subject = text.encode('ascii')
+    hits = []
+    match = scanner.search(subject)
+    while match is not None:
+        hits.append((match.start(), match.lastgroup))
+        match = scanner.search(subject, match.start() + 1)
+    return hits
+
+
+def _has_content(text: Optional[str], min_chars: int = 50) -> bool:
+    """
+    Check len(text.strip()) > min_chars without copying the text.
+    
+    Extractors return whole documents, so only the leading and trailing
+    whitespace is scanned instead of allocating a stripped copy.
+    """
+    if not text or len(text) <= min_chars:
+        return False
+    first = _NONSPACE_RE.search(text)
+    if first is None:
+        return False
+    end = len(text)
+    while text[end - 1].isspace():
+        end -= 1
+    return end - first.start() > min_chars
+
 
 class ResumeParser:
     """
     Advanced resume parser that extracts text and metadata from PDF and DOCX files.
     """
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, cache_max_entries: int = 256):
+        """
+        Initialize the parser.
+        
+        Args:
+            cache_dir: Directory for parse results keyed by file content;
+                defaults to PARSE_CACHE_DIR. The cache holds full resume
+                text, so it is disabled unless one of the two is set.
+            cache_max_entries: Cached results kept before the least
+                recently used are deleted
+        """
         self.supported_formats = ['.pdf', '.docx', '.txt']
+        if cache_dir is None:
+            cache_dir = os.getenv('PARSE_CACHE_DIR')
+        self.cache_dir = cache_dir or None
+        self.cache_max_entries = cache_max_entries
         logger.info("ResumeParser initialized")
     
-    def parse_pdf(self, file_path: str) -> str:
+    def parse_pdf(self, file_path: Union[str, bytes]) -> str:
         """
         Extract text from PDF using multiple methods for reliability.
         
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, or the file's raw bytes
             
         Returns:
             Extracted text content
         """
         try:
-            # Try pdfplumber first (better for complex layouts)
+            # Try PDFium first (C++ text extraction, fastest backend)
+            if _optional_import('pypdfium2') is not None:
+                try:
+                    text = self._parse_with_pdfium(file_path)
+                    if _has_content(text):
+                        return text
+                except Exception as e:
+                    logger.warning(f"PDFium failed, falling back: {e}")
+            
+            # Then PyMuPDF (C-backed, much faster than pdfminer); also
+            # importable as "pymupdf" from 1.24
+            if _optional_import('fitz') is not None:
+                try:
+                    text = self._parse_with_pymupdf(file_path)
+                    if _has_content(text):
+                        return text
+                except Exception as e:
+                    logger.warning(f"PyMuPDF failed, falling back: {e}")
+            
+            # Then pdfplumber (better for complex layouts)
             text = self._parse_with_pdfplumber(file_path)
-            if text and len(text.strip()) > 50:
+            if _has_content(text):
                 return text
             
             # Fallback to PyPDF2
@@ -47,38 +251,72 @@ class ResumeParser:
             logger.error(f"Error parsing PDF: {e}")
             raise ValueError(f"Failed to parse PDF: {str(e)}")
     
-    def _parse_with_pdfplumber(self, file_path: str) -> str:
+    def _parse_with_pdfium(self, file_path: Union[str, bytes]) -> str:
+        """Parse PDF using pypdfium2."""
+        pdfium = _optional_import('pypdfium2')
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            text_content = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                text_content.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            # PDFium separates lines with CRLF
+            return "\n".join(text_content).replace('\r\n', '\n')
+        finally:
+            pdf.close()
+    
+    def _parse_with_pymupdf(self, file_path: Union[str, bytes]) -> str:
+        """Parse PDF using PyMuPDF."""
+        pymupdf = _optional_import('fitz')
+        if isinstance(file_path, bytes):
+            doc = pymupdf.open(stream=file_path, filetype="pdf")
+        else:
+            doc = pymupdf.open(file_path)
+        with doc:
+            return "\n".join(page.get_text("text") for page in doc)
+    
+    def _parse_with_pdfplumber(self, file_path: Union[str, bytes]) -> str:
         """Parse PDF using pdfplumber."""
-        text_content = []
+        import pdfplumber
+        
+        if isinstance(file_path, bytes):
+            file_path = BytesIO(file_path)
         with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    text_content.append(text)
-        return "\n".join(text_content)
+            return "\n".join(filter(None, (page.extract_text() for page in pdf.pages)))
     
-    def _parse_with_pypdf2(self, file_path: str) -> str:
+    def _parse_with_pypdf2(self, file_path: Union[str, bytes]) -> str:
         """Parse PDF using PyPDF2 as fallback."""
-        text_content = []
-        with open(file_path, 'rb') as file:
+        import PyPDF2
+        
+        with (BytesIO(file_path) if isinstance(file_path, bytes) else open(file_path, 'rb')) as file:
             pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_content.append(text)
-        return "\n".join(text_content)
+            return "\n".join(filter(None, (page.extract_text() for page in pdf_reader.pages)))
     
-    def parse_docx(self, file_path: str) -> str:
+    def parse_docx(self, file_path: Union[str, bytes]) -> str:
         """
         Extract text from DOCX file.
         
         Args:
-            file_path: Path to DOCX file
+            file_path: Path to DOCX file, or the file's raw bytes
             
         Returns:
             Extracted text content
         """
+        if isinstance(file_path, bytes):
+            file_path = BytesIO(file_path)
+        
+        try:
+            return self._parse_docx_xml(file_path)
+        except Exception as e:
+            logger.warning(f"DOCX XML scan failed, falling back to python-docx: {e}")
+            if hasattr(file_path, 'seek'):
+                file_path.seek(0)
+        
         try:
+            from docx import Document
+            
             doc = Document(file_path)
             text_content = []
             
@@ -99,6 +337,31 @@ class ResumeParser:
             logger.error(f"Error parsing DOCX: {e}")
             raise ValueError(f"Failed to parse DOCX: {str(e)}")
     
+    def _parse_docx_xml(self, file_path) -> str:
+        """
+        Parse DOCX by reading word/document.xml directly with lxml.
+        
+        Mirrors the python-docx extraction (body paragraphs, then the
+        cells of top-level tables) without building a Paragraph object
+        and resolving styles for every paragraph.
+        """
+        from lxml import etree
+        
+        with zipfile.ZipFile(file_path) as archive:
+            root = etree.fromstring(archive.read('word/document.xml'))
+        body = root.find(f'{_W}body')
+        
+        paragraphs = []
+        cells = []
+        for child in body:
+            if child.tag == f'{_W}p':
+                paragraphs.append(_docx_paragraph_text(child))
+            elif child.tag == f'{_W}tbl':
+                cells.extend(_docx_table_cells(child))
+        
+        # Keep entries with any non-whitespace, without stripped copies
+        return "\n".join(filter(_NONSPACE_RE.search, chain(paragraphs, cells)))
+    
     def parse_file(self, file_path: str) -> Dict[str, any]:
         """
         Parse resume file and extract text with metadata.
@@ -119,17 +382,107 @@ class ResumeParser:
         if extension not in self.supported_formats:
             raise ValueError(f"Unsupported file format: {extension}")
         
+        cache_path = self._cache_path(generate_file_hash(str(file_path)), extension) if self.cache_dir else None
+        cached = self._load_cached(cache_path, file_path.name)
+        if cached is not None:
+            return cached
+        
         # Extract text based on file type
         if extension == '.pdf':
             text = self.parse_pdf(str(file_path))
         elif extension == '.docx':
             text = self.parse_docx(str(file_path))
         elif extension == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            # Decode straight from the mapped file; line endings are left
+            # as-is since clean_text collapses all whitespace anyway
+            with map_file(str(file_path)) as buffer:
+                text = str(buffer, 'utf-8')
         else:
             raise ValueError(f"Unsupported format: {extension}")
         
+        return self._store_cached(cache_path, self._build_result(text, file_path.name, extension))
+    
+    def parse_bytes(self, data: bytes, filename: str) -> Dict[str, any]:
+        """
+        Parse an in-memory resume, e.g. an upload that was never written to disk.
+        
+        Args:
+            data: Raw file content
+            filename: Original file name, used to pick the parser
+            
+        Returns:
+            Dictionary containing parsed content and metadata
+        """
+        extension = Path(filename).suffix.lower()
+        
+        if extension not in self.supported_formats:
+            raise ValueError(f"Unsupported file format: {extension}")
+        
+        cache_path = self._cache_path(hashlib.sha256(data).hexdigest(), extension) if self.cache_dir else None
+        cached = self._load_cached(cache_path, Path(filename).name)
+        if cached is not None:
+            return cached
+        
+        if extension == '.pdf':
+            text = self.parse_pdf(data)
+        elif extension == '.docx':
+            text = self.parse_docx(data)
+        else:
+            text = data.decode('utf-8')
+        
+        return self._store_cached(cache_path, self._build_result(text, Path(filename).name, extension))
+    
+    def _cache_path(self, digest: str, extension: str) -> str:
+        """Return the cache file for a content digest and file type."""
+        return os.path.join(
+            self.cache_dir, f"{digest}{extension}.v{PARSE_CACHE_VERSION}.json"
+        )
+    
+    def _load_cached(self, cache_path: Optional[str], file_name: str) -> Optional[Dict[str, any]]:
+        """Return a cached parse result, relabelled with the current file name."""
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        try:
+            result = load_json(cache_path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {cache_path}: {e}")
+            return None
+        # Mark as recently used for eviction
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        # Identical content may arrive under a different name
+        result["file_name"] = file_name
+        return result
+    
+    def _store_cached(self, cache_path: Optional[str], result: Dict[str, any]) -> Dict[str, any]:
+        """Persist a parse result if caching is enabled and return it."""
+        if cache_path:
+            try:
+                save_json(result, cache_path)
+                self._evict_cached()
+            except Exception as e:
+                logger.warning(f"Could not write parse cache entry {cache_path}: {e}")
+        return result
+    
+    def _evict_cached(self):
+        """Delete the least recently used entries beyond cache_max_entries."""
+        with os.scandir(self.cache_dir) as entries:
+            files = [entry for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+        excess = len(files) - self.cache_max_entries
+        if excess <= 0:
+            return
+        
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:excess]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+    
+    def _build_result(self, text: str, file_name: str, extension: str) -> Dict[str, any]:
+        """Clean extracted text and assemble the parse result."""
         # Clean and normalize text
         text = self.clean_text(text)
         
@@ -137,12 +490,12 @@ class ResumeParser:
         metadata = self.extract_metadata(text)
         
         return {
-            "raw_text": text,
             "cleaned_text": text,
-            "file_name": file_path.name,
+            "file_name": file_name,
             "file_type": extension,
             "metadata": metadata,
-            "word_count": len(text.split()),
+            # Cleaned text separates words with exactly one space
+            "word_count": text.count(' ') + 1 if text else 0,
             "char_count": len(text)
         }
     
@@ -156,14 +509,16 @@ class ResumeParser:
         Returns:
             Cleaned text
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s\.,;:\-\(\)@/]', '', text)
+        # Remove special characters but keep important punctuation; plain
+        # ASCII text takes a single C-level translate pass
+        if text.isascii():
+            text = text.translate(_ASCII_SPECIAL_DELETE)
+        else:
+            text = _SPECIAL_RE.sub('', text)
         
-        # Normalize line breaks
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        # Remove excessive whitespace (this also turns line breaks into
+        # spaces); done last so words are always separated by one space
+        text = _WS_RE.sub(' ', text)
         
         return text.strip()
     
@@ -180,24 +535,19 @@ class ResumeParser:
         metadata = {}
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        metadata['emails'] = emails[:1] if emails else []
+        email = _EMAIL_RE.search(text)
+        metadata['emails'] = [email.group(0)] if email else []
         
-        # Extract phone numbers
-        phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, text)
-        metadata['phones'] = [p[0] + p[1] if isinstance(p, tuple) else p for p in phones[:2]]
+        # Extract phone numbers (full matches; only the first two are kept)
+        metadata['phones'] = [m.group(0) for m in islice(_PHONE_RE.finditer(text), 2)]
         
         # Extract LinkedIn
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin = re.findall(linkedin_pattern, text.lower())
-        metadata['linkedin'] = linkedin[0] if linkedin else None
+        linkedin = _LINKEDIN_RE.search(text)
+        metadata['linkedin'] = linkedin.group(0).lower() if linkedin else None
         
         # Extract GitHub
-        github_pattern = r'github\.com/[\w-]+'
-        github = re.findall(github_pattern, text.lower())
-        metadata['github'] = github[0] if github else None
+        github = _GITHUB_RE.search(text)
+        metadata['github'] = github.group(0).lower() if github else None
         
         return metadata
     
@@ -213,33 +563,25 @@ class ResumeParser:
         """
         sections = {}
         
-        # Common section headers
-        section_patterns = {
-            'summary': r'(professional summary|summary|profile|objective)',
-            'experience': r'(work experience|experience|employment history|professional experience)',
-            'education': r'(education|academic background|qualifications)',
-            'skills': r'(skills|technical skills|core competencies|expertise)',
-            'projects': r'(projects|portfolio)',
-            'certifications': r'(certifications|certificates|licenses)'
-        }
+        # One scan collects every header position; each section then runs
+        # from its first header to the first header of a different section
+        # at least 50 characters later
+        hits = _section_hits(text)
+        positions = [pos for pos, _ in hits]
         
-        text_lower = text.lower()
-        
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, text_lower)
-            if match:
-                start_idx = match.start()
-                # Find next section or end of text
-                next_section_idx = len(text)
-                for other_pattern in section_patterns.values():
-                    if other_pattern != pattern:
-                        next_match = re.search(other_pattern, text_lower[start_idx + 50:])
-                        if next_match:
-                            candidate_idx = start_idx + 50 + next_match.start()
-                            if candidate_idx < next_section_idx:
-                                next_section_idx = candidate_idx
-                
-                sections[section_name] = text[start_idx:next_section_idx].strip()
+        for section_name in _SECTION_PATTERNS:
+            start_idx = next((pos for pos, name in hits if name == section_name), None)
+            if start_idx is None:
+                continue
+            
+            # Find next section or end of text
+            next_section_idx = len(text)
+            for pos, name in hits[bisect_left(positions, start_idx + 50):]:
+                if name != section_name:
+                    next_section_idx = pos
+                    break
+            
+            sections[section_name] = text[start_idx:next_section_idx].strip()
         
         return sections
 
@@ -5,14 +5,29 @@ Helper functions for the Resume Analyzer system.
 
 import os
 import json
+import math
+import atexit
 import hashlib
+import mmap
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Set
 import logging
 from pathlib import Path
 
+try:
+    import orjson  # Rust JSON codec, several times faster than stdlib json
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Directories ensure_dir has already created or found
+_ENSURED_DIRS: Set[str] = set()
+
 
 def setup_logging(log_file: str = "logs/app.log", level: str = "INFO"):
     """
@@ -23,9 +38,7 @@ def setup_logging(log_file: str = "logs/app.log", level: str = "INFO"):
         level: Logging level
     """
     # Create logs directory if it doesn't exist
-    log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    ensure_dir(os.path.dirname(log_file))
     
     logging.basicConfig(
         level=getattr(logging, level),
@@ -38,6 +51,36 @@ def setup_logging(log_file: str = "logs/app.log", level: str = "INFO"):
     logger.info("Logging initialized")
 
 
+def _has_non_finite(value: Any) -> bool:
+    """Return True if value contains a NaN or infinite float."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def _orjson_dumps(data: Any) -> Optional[bytes]:
+    """
+    Encode data with orjson, or return None where its output would differ
+    from json.dump's.
+    
+    orjson writes NaN/Infinity as null and rejects some types json.dump
+    accepts, so those payloads are left to the stdlib encoder.
+    """
+    if orjson is None or _has_non_finite(data):
+        return None
+    try:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    except TypeError:
+        return None
+
+
 def save_json(data: Dict, filepath: str):
     """
     Save data to JSON file.
@@ -47,15 +90,43 @@ def save_json(data: Dict, filepath: str):
         filepath: Output file path
     """
     try:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        ensure_dir(os.path.dirname(filepath))
+        encoded = _orjson_dumps(data)
+        if encoded is not None:
+            with open(filepath, 'wb') as f:
+                f.write(encoded)
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         logger.info(f"Saved data to {filepath}")
     except Exception as e:
         logger.error(f"Failed to save JSON: {e}")
         raise
 
 
+@contextmanager
+def map_file(filepath: str) -> Iterator[memoryview]:
+    """
+    Map a file read-only and yield a view of its bytes.
+    
+    Lets decoders (str(), orjson.loads) read the page cache directly
+    instead of first copying the whole file into a bytes object.
+    
+    Args:
+        filepath: File to map
+        
+    Yields:
+        Read-only memoryview of the file content (empty for empty files)
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:  # empty files cannot be mapped
+            yield memoryview(b'')
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                yield view
+
+
 def load_json(filepath: str) -> Dict:
     """
     Load data from JSON file.
@@ -67,8 +138,12 @@ def load_json(filepath: str) -> Dict:
         Loaded dictionary
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with map_file(filepath) as buffer:
+                data = orjson.loads(buffer)
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         logger.info(f"Loaded data from {filepath}")
         return data
     except Exception as e:
@@ -76,21 +151,233 @@ def load_json(filepath: str) -> Dict:
         raise
 
 
-def generate_file_hash(filepath: str) -> str:
+def generate_file_hash(filepath: str, algorithm: str = "sha256") -> str:
     """
-    Generate MD5 hash of file.
+    Generate hash of file.
     
     Args:
         filepath: Path to file
+        algorithm: hashlib algorithm name; SHA-256 is hardware-accelerated
+            (SHA-NI) on most current CPUs
         
     Returns:
-        MD5 hash string
+        Hex digest string
     """
-    hash_md5 = hashlib.md5()
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+, hashes in C
+            return hashlib.file_digest(f, algorithm).hexdigest()
+        file_hash = hashlib.new(algorithm)
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def text_hash(text: str) -> bytes:
+    """
+    Generate a compact hash of text for use as a cache key.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+class LRUCache:
+    """
+    Thread-safe bounded cache that evicts the least recently used entry.
+    
+    Entries can optionally expire a fixed number of seconds after they
+    were stored.
+    """
+    
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None):
+        """
+        Initialize cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid, or None to never expire
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _lookup(self, key: Hashable) -> tuple:
+        """Return (found, value) for key, dropping it if expired. Caller holds the lock."""
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, value
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing."""
+        with self._lock:
+            found, value = self._lookup(key)
+            return value if found else default
+    
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the oldest entry if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def get_or_set(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+        
+        Args:
+            key: Cache key
+            compute: Zero-argument callable producing the value
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+        
+        # Compute outside the lock so slow work does not block other readers
+        value = compute()
+        self.set(key, value)
+        return value
+    
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class Lazy:
+    """
+    Proxy that constructs its target on first attribute access.
+    
+    Lets components hold a reference to a heavy model without paying
+    its load cost until a code path actually uses it. The factory runs
+    at most once, even when several threads touch the proxy together.
+    """
+    
+    _UNSET = object()
+    
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        Initialize proxy.
+        
+        Args:
+            factory: Zero-argument callable building the target
+        """
+        self._factory = factory
+        self._value = self._UNSET
+        self._lock = threading.Lock()
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the target has been constructed."""
+        return self._value is not self._UNSET
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the proxy itself
+        if self._value is self._UNSET:
+            with self._lock:
+                # Re-check so concurrent first uses build the target once
+                if self._value is self._UNSET:
+                    self._value = self._factory()
+        return getattr(self._value, name)
+
+
+class _LogWriter:
+    """
+    Batches JSON lines for one log file.
+    
+    Pending lines are appended in a single write once flush_every have
+    accumulated or flush_interval seconds after the first one arrived,
+    instead of opening the file for every entry.
+    """
+    
+    def __init__(self, path: str, flush_every: int = 100, flush_interval: float = 1.0):
+        """
+        Initialize writer.
+        
+        Args:
+            path: Log file path
+            flush_every: Number of pending lines that triggers a write
+            flush_interval: Maximum seconds a line waits before being written
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending: List[str] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+    
+    def append(self, line: str):
+        """Queue one line, writing the batch if it is full."""
+        with self._lock:
+            self._pending.append(line)
+            if len(self._pending) >= self.flush_every:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def flush(self):
+        """Write all pending lines."""
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        """Write pending lines. Caller holds the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        
+        lines, self._pending = self._pending, []
+        try:
+            ensure_dir(os.path.dirname(self.path))
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+        except Exception as e:
+            logger.error(f"Failed to log analysis: {e}")
+
+
+_log_writers: Dict[str, _LogWriter] = {}
+_log_writers_lock = threading.Lock()
+
+
+def _get_log_writer(log_file: str) -> _LogWriter:
+    """Return the shared writer for log_file."""
+    with _log_writers_lock:
+        writer = _log_writers.get(log_file)
+        if writer is None:
+            writer = _log_writers[log_file] = _LogWriter(log_file)
+        return writer
+
+
+@atexit.register
+def flush_analysis_logs():
+    """Write all buffered analysis log entries to disk."""
+    with _log_writers_lock:
+        writers = list(_log_writers.values())
+    for writer in writers:
+        writer.flush()
 
 
 def log_analysis(
@@ -102,6 +389,9 @@ def log_analysis(
     """
     Log analysis results for monitoring.
     
+    Entries are buffered and written in batches; call
+    flush_analysis_logs() to force them out (this also runs at exit).
+    
     Args:
         resume_name: Name of resume file
         ats_score: ATS compatibility score
@@ -116,9 +406,7 @@ def log_analysis(
     }
     
     try:
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        _get_log_writer(log_file).append(json.dumps(log_entry) + '\n')
     except Exception as e:
         logger.error(f"Failed to log analysis: {e}")
 
@@ -186,6 +474,30 @@ def validate_file_upload(file_path: str, max_size_mb: int = 10) -> bool:
     return True
 
 
+def validate_file_bytes(data: bytes, file_name: str, max_size_mb: int = 10) -> bool:
+    """
+    Validate an in-memory upload.
+    
+    Args:
+        data: File content
+        file_name: Original file name
+        max_size_mb: Maximum file size in MB
+        
+    Returns:
+        True if valid, raises exception otherwise
+    """
+    file_size_mb = len(data) / (1024 * 1024)
+    if file_size_mb > max_size_mb:
+        raise ValueError(f"File too large: {file_size_mb:.1f}MB (max: {max_size_mb}MB)")
+    
+    valid_extensions = ['.pdf', '.docx', '.txt']
+    file_ext = os.path.splitext(file_name)[1].lower()
+    if file_ext not in valid_extensions:
+        raise ValueError(f"Invalid file type: {file_ext}")
+    
+    return True
+
+
 def create_result_summary(analysis_results: Dict) -> str:
     """
     Create a summary of analysis results.
@@ -208,9 +520,7 @@ def create_result_summary(analysis_results: Dict) -> str:
     
     # Skills
     if 'skills' in analysis_results:
-        total_skills = sum(
-            len(skills) for skills in analysis_results['skills'].values()
-        )
+        total_skills = sum(map(len, analysis_results['skills'].values()))
         summary_parts.append(f"🎯 **Skills Found**: {total_skills}")
     
     # Experience
@@ -236,6 +546,17 @@ def get_timestamp() -> str:
 
 
 def ensure_dir(directory: str):
-    """Ensure directory exists."""
+    """
+    Ensure directory exists.
+    
+    Directories already created or found by this process are remembered,
+    so repeat calls (one per saved file or log batch) skip the syscalls.
+    
+    Args:
+        directory: Directory path; empty means the current directory
+    """
+    if not directory or directory in _ENSURED_DIRS:
+        return
     Path(directory).mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(directory)
 
@@ -0,0 +1,72 @@
+"""
+Tests for NLPProcessor skill extraction.
+"""
+
+import pytest
+
+from src.nlp_processor import NLPProcessor
+
+
+@pytest.fixture(scope="module")
+def processor():
+    return NLPProcessor()
+
+
+# Skills the whole-word r'\b...\b' search finds inside punctuation and URLs
+PUNCTUATED_CASES = [
+    ("Built dashboards in React.js and Node.js", "web", "react"),
+    ("Statistical modelling using R.", "programming", "r"),
+    ("Code at github.com/johndoe", "tools", "github"),
+    ("Deployed (AWS/GCP) services", "cloud", "aws"),
+]
+
+
+@pytest.mark.parametrize("text,category,skill", PUNCTUATED_CASES)
+def test_extract_skills_punctuated(processor, text, category, skill):
+    assert skill in processor.extract_skills(text).get(category, [])
+
+
+@pytest.mark.parametrize("text,category,skill", PUNCTUATED_CASES)
+def test_extract_skills_punctuated_regex_fallback(processor, monkeypatch, text, category, skill):
+    monkeypatch.setattr(processor, "_skill_automaton", None)
+    assert skill in processor.extract_skills(text).get(category, [])
+
+
+def test_extract_skills_requires_whole_words(processor):
+    skills = processor.extract_skills("Javascripts and gitter")
+    assert "javascript" not in skills.get("programming", [])
+    assert "git" not in skills.get("tools", [])
+
+
+MULTI_LINE_RESUME = "\n".join([
+    "EXPERIENCE",
+    "Senior Engineer 2019 - 2023",
+    "GOOGLE",
+    "Built search infrastructure",
+    "Engineer 2015 - 2019",
+    "IBM",
+    "Maintained mainframe tooling",
+    "EDUCATION",
+    "B.S. Computer Science 2015",
+])
+
+
+def test_find_section_ignores_all_caps_company_lines(processor):
+    section = processor._find_section(MULTI_LINE_RESUME, processor.EXPERIENCE_KEYWORDS)
+    assert section.startswith("EXPERIENCE")
+    assert "IBM" in section
+    assert "EDUCATION" not in section
+
+
+def test_extract_experience_keeps_every_job(processor):
+    experiences = processor.extract_experience(MULTI_LINE_RESUME)
+    assert [row["raw_text"] for row in experiences] == [
+        "Senior Engineer 2019 - 2023",
+        "Engineer 2015 - 2019",
+    ]
+
+
+def test_find_section_tries_keywords_in_priority_order(processor):
+    text = "Employment:\nContractor 2010 - 2012\nExperience:\nEngineer 2012 - 2020"
+    section = processor._find_section(text, ["experience", "employment"])
+    assert section.startswith("Experience:")
@@ -0,0 +1,57 @@
+"""
+Tests for ResumeParser DOCX extraction.
+"""
+
+import io
+
+import pytest
+from docx import Document
+from docx.enum.text import WD_BREAK
+
+from src.resume_parser import ResumeParser
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return ResumeParser(cache_dir="")
+
+
+def _docx_bytes(document) -> bytes:
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _python_docx_text(data: bytes) -> str:
+    """Reference extraction through python-docx's object model."""
+    document = Document(io.BytesIO(data))
+    texts = [p.text for p in document.paragraphs if p.text.strip()]
+    for table in document.tables:
+        for row in table.rows:
+            texts.extend(cell.text for cell in row.cells if cell.text.strip())
+    return "\n".join(texts)
+
+
+def test_docx_breaks_match_python_docx(parser):
+    document = Document()
+    paragraph = document.add_paragraph("line")
+    paragraph.add_run().add_break()
+    paragraph.add_run("page")
+    paragraph.add_run().add_break(WD_BREAK.PAGE)
+    paragraph.add_run("next")
+    data = _docx_bytes(document)
+    
+    assert parser._parse_docx_xml(io.BytesIO(data)) == "line\npagenext"
+    assert parser._parse_docx_xml(io.BytesIO(data)) == _python_docx_text(data)
+
+
+def test_docx_merged_cells_match_python_docx(parser):
+    document = Document()
+    table = document.add_table(rows=3, cols=3)
+    for index, cell in enumerate(table._cells):
+        cell.text = f"cell {index}"
+    table.cell(0, 0).merge(table.cell(2, 0))
+    table.cell(0, 1).merge(table.cell(0, 2))
+    data = _docx_bytes(document)
+    
+    assert parser._parse_docx_xml(io.BytesIO(data)) == _python_docx_text(data)